@@ -2,12 +2,15 @@
 
 import argparse
 import contextlib
+import cProfile
 import importlib.metadata
 import io
+import json
 import logging
 import logging.handlers
 import pathlib
 import sys
+import time
 import warnings
 
 import colorama
@@ -15,6 +18,8 @@ import termcolor
 import yaml
 
 from . import create_app
+from ._core.tracing import Progress, Tracer
+from ._processors.jinja2 import compile_theme
 
 
 def create_app_from_yml(path):
@@ -42,7 +47,7 @@ def create_app_from_yml(path):
 
 
 @contextlib.contextmanager
-def configure_logger(level):
+def configure_logger(level, *, capacity=-1, interval=1.0, log_file=None, before_flush=None):
     """Configure a root logger to print records in pretty format.
 
     The format is more readable for end users, since it's not necessary at
@@ -55,34 +60,131 @@ def configure_logger(level):
         [ERRO] message
 
     :param level: a minimum logging level to be printed
+    :param capacity: a number of records to buffer before printing them; if
+        negative, all records are printed on exit
+    :param interval: a minimum number of seconds between two consecutive
+        prints of buffered records, unless the buffer is full
+    :param log_file: a path to a file to write records to as JSON lines
+    :param before_flush: a function to call before buffered records are
+        printed (e.g. to erase a progress line sharing the same stream)
     """
 
     class _PendingHandler(logging.handlers.MemoryHandler):
-        def __init__(self, target):
-            super().__init__(capacity=-1, target=target)
+        def __init__(self, target, capacity, interval, before_flush):
+            super().__init__(capacity=capacity, target=target)
+            self._interval = interval
+            self._before_flush = before_flush
+            self._flushed_at = time.monotonic()
 
         def shouldFlush(self, record):
-            return False
+            # Negative capacity means records are buffered until exit, which
+            # is the way to go for short builds since log records are not
+            # interleaved with progress output.
+            if self.capacity < 0:
+                return False
+
+            # Otherwise we want to print records as soon as they come, yet
+            # not too often in order to avoid flooding the console.
+            return (
+                len(self.buffer) >= self.capacity
+                or time.monotonic() - self._flushed_at >= self._interval
+            )
+
+        def flush(self):
+            if self.buffer and self._before_flush:
+                self._before_flush()
+
+            super().flush()
+            self._flushed_at = time.monotonic()
 
     class _Formatter(logging.Formatter):
         def format(self, record):
+            # Records are shared between handlers, so we must not modify a
+            # record in-place; otherwise other handlers will see the change.
+            record = logging.makeLogRecord(record.__dict__)
             record.levelname = record.levelname[:4]
             return super().format(record)
 
+    class _JSONFormatter(logging.Formatter):
+        def format(self, record):
+            entry = {
+                "time": self.formatTime(record),
+                "level": logging.getLevelName(record.levelno),
+                "logger": record.name,
+                "message": record.getMessage(),
+            }
+            if record.exc_info:
+                entry["exc_info"] = self.formatException(record.exc_info)
+            return json.dumps(entry)
+
     # create stream handler with custom formatter
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(_Formatter("[%(levelname)s] %(message)s"))
-    pending_handler = _PendingHandler(stream_handler)
+    pending_handler = _PendingHandler(stream_handler, capacity, interval, before_flush)
 
     # configure root logger
     logger = logging.getLogger()
-    logger.addHandler(pending_handler)
     logger.setLevel(level)
 
-    # capture warnings issued by 'warnings' module
-    logging.captureWarnings(capture=True)
-    yield
-    pending_handler.flush()
+    with contextlib.ExitStack() as exit:
+        logger.addHandler(pending_handler)
+        exit.callback(logger.removeHandler, pending_handler)
+        exit.callback(pending_handler.flush)
+
+        if log_file:
+            file_handler = logging.FileHandler(log_file, encoding="UTF-8")
+            file_handler.setFormatter(_JSONFormatter())
+            logger.addHandler(file_handler)
+            exit.callback(file_handler.close)
+            exit.callback(logger.removeHandler, file_handler)
+
+        # capture warnings issued by 'warnings' module
+        logging.captureWarnings(capture=True)
+        yield
+
+
+@contextlib.contextmanager
+def profile(path):
+    """Profile a code block with cProfile and dump stats to a given path.
+
+    :param path: a path to save stats to; if None, nothing is profiled
+    """
+
+    if not path:
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+
+
+@contextlib.contextmanager
+def trace(app, path):
+    """Trace pipes invoked by an application and dump events to a given path.
+
+    Events are dumped even if a pipe fails, since a trace is most useful for
+    finding out what has broken or stalled a build.
+
+    :param app: an application to trace pipes of
+    :param path: a path to save events to; if None, nothing is traced
+    """
+
+    if not path:
+        yield
+        return
+
+    tracer = Tracer()
+    app.add_tracer(tracer)
+    try:
+        yield
+    finally:
+        with open(path, "w", encoding="UTF-8") as f:
+            tracer.dump(f)
 
 
 def parse_command_line(args):
@@ -145,10 +247,45 @@ def parse_command_line(args):
         help="show the holocron version and exit",
     )
 
+    parser.add_argument(
+        "--log-buffer",
+        dest="log_buffer",
+        type=int,
+        default=-1,
+        metavar="N",
+        help="print log records once N of them are buffered (0 to stream them "
+        "as they come); by default log records are printed on exit",
+    )
+
+    parser.add_argument(
+        "--log-file",
+        dest="log_file",
+        metavar="PATH",
+        help="write log records to a file as JSON lines",
+    )
+
     command_parser = parser.add_subparsers(dest="command", help="command to execute")
 
     run_parser = command_parser.add_parser("run")
     run_parser.add_argument("pipe", help="a pipe to run")
+    run_parser.add_argument(
+        "--trace",
+        dest="trace",
+        metavar="PATH",
+        help="write a Chrome Trace Event file with a span per processor per item",
+    )
+    run_parser.add_argument(
+        "--profile",
+        dest="profile",
+        metavar="PATH",
+        help="write a cProfile dump of the pipe run",
+    )
+
+    compile_theme_parser = command_parser.add_parser(
+        "compile-theme",
+        help="precompile templates of a jinja2 theme",
+    )
+    compile_theme_parser.add_argument("theme", help="a path to a theme to compile")
 
     # parse cli and form arguments object
     arguments = parser.parse_args(args)
@@ -166,23 +303,53 @@ def main(args=sys.argv[1:]):
     # incompatible changes
     warnings.filterwarnings("always", category=DeprecationWarning)
     arguments = parse_command_line(args)
+    verbosity = arguments.verbosity or logging.WARNING
 
     # colorama.init() does two great things Holocron depends on. First, it
     # converts ANSI escape sequences printed to standard streams into proper
     # Windows API calls. Second, it strips ANSI colors away from a stream if
     # it's not connected to a tty (e.g. holocron is called from pipe).
     with colorama.colorama_text():
+        # Progress is rendered instead of per-item lines unless the latter
+        # are requested explicitly, since they interfere with each other.
+        # Quiet mode, however, means quiet.
+        progress = None
+        if verbosity <= logging.ERROR:
+            progress = Progress(sys.stderr, live=verbosity > logging.INFO)
+
         # initial logger configuration - use custom format for records
-        # and print records with WARNING level and higher.
-        with configure_logger(arguments.verbosity or logging.WARNING):
+        # and print records with WARNING level and higher. Log records and
+        # progress share the same stream, so the progress line is erased
+        # before records are printed, and is rendered again on next refresh.
+        with configure_logger(
+            verbosity,
+            capacity=arguments.log_buffer,
+            log_file=arguments.log_file,
+            before_flush=progress.clear if progress else None,
+        ):
             try:
+                if arguments.command == "compile-theme":
+                    compile_theme(arguments.theme)
+                    return
+
                 holocron = create_app_from_yml(arguments.conf)
 
-                for item in holocron.invoke(arguments.pipe):
-                    print(
-                        termcolor.colored("==>", "green", attrs=["bold"]),
-                        termcolor.colored(item["destination"], attrs=["bold"]),
-                    )
+                if progress:
+                    holocron.add_tracer(progress)
+
+                with trace(holocron, arguments.trace), profile(arguments.profile):
+                    for item in holocron.invoke(arguments.pipe):
+                        if verbosity <= logging.INFO:
+                            print(
+                                termcolor.colored("==>", "green", attrs=["bold"]),
+                                termcolor.colored(item["destination"], attrs=["bold"]),
+                            )
+
+                        if progress:
+                            progress.advance()
+
+                if progress:
+                    progress.finish()
             except (RuntimeError, IsADirectoryError) as exc:
                 print(str(exc), file=sys.stderr)
                 sys.exit(1)
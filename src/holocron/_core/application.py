@@ -1,7 +1,9 @@
 """Holocron, The Application."""
 
 import collections
+import contextlib
 import logging
+import threading
 
 from holocron._processors import _misc
 
@@ -44,10 +46,73 @@ class Application:
         # when invoked.
         self._pipes = {}
 
+        # Tracers observe pipes execution: they are notified about every
+        # item produced by every processor, and about metrics reported by
+        # processors. They are used to troubleshoot and report progress of
+        # builds, and are not set by default in order to avoid any overhead.
+        self._tracers = []
+
+        # Resources are expensive objects (e.g. template environments, markup
+        # parsers) that processors would otherwise build on every invocation.
+        # They live for the application lifetime, and are shared between
+        # invocations of processors (even between pipes) that need them set
+        # up the same way, which is what their keys encode.
+        self._resources = {}
+        self._resources_lock = threading.RLock()
+
+        # Some state (e.g. which theme statics have been produced) must be
+        # shared between processors of one build only. Such resources live
+        # until the outermost invocation of a pipe is started again, since
+        # processors may invoke sub pipes within a build.
+        self._invoke_resources = {}
+        self._invoke_depth = 0
+
     @property
     def metadata(self):
         return self._metadata
 
+    def add_tracer(self, tracer):
+        self._tracers.append(tracer)
+
+    def metric(self, name, value):
+        # Processors may report metrics (e.g. a number of items they are
+        # going to produce, or a number of bytes written) that tracers may
+        # use to provide more insights about a build.
+        for tracer in self._tracers:
+            tracer.metric(name, value)
+
+    def resource(self, key, factory, *, per_invoke=False):
+        # Resources are created under the lock in order to ensure that
+        # concurrent processors do not create the same resource twice. The
+        # lock is reentrant since a factory may require another resource.
+        with self._resources_lock:
+            resources = self._invoke_resources if per_invoke else self._resources
+
+            if key not in resources:
+                resources[key] = factory()
+            return resources[key]
+
+    def invalidate_resource(self, key=None):
+        with self._resources_lock:
+            for resources in (self._resources, self._invoke_resources):
+                if key is None:
+                    resources.clear()
+                else:
+                    resources.pop(key, None)
+
+    @contextlib.contextmanager
+    def _invoking(self):
+        with self._resources_lock:
+            if self._invoke_depth == 0:
+                self._invoke_resources.clear()
+            self._invoke_depth += 1
+
+        try:
+            yield
+        finally:
+            with self._resources_lock:
+                self._invoke_depth -= 1
+
     def add_processor(self, name, processor):
         if name in self._processors:
             _logger.warning("processor override: '%s'", name)
@@ -84,6 +149,10 @@ class Application:
         # established contracts.
         stream = iter(stream or [])
 
+        with self._invoking():
+            yield from self._invoke(pipe, stream)
+
+    def _invoke(self, pipe, stream):
         for processor in pipe:
             # Resolve every JSON reference we encounter in a processor's
             # parameters. Please note, we're doing this so late because we
@@ -102,6 +171,9 @@ class Application:
             processfn = self._processors[name]
             stream = processfn(self, stream, *args, **kwargs)
 
+            for tracer in self._tracers:
+                stream = tracer.trace(name, stream)
+
         yield from stream
 
 
@@ -0,0 +1,186 @@
+"""Trace processors execution."""
+
+import json
+import os
+import threading
+import time
+
+
+class Tracer:
+    """Record processors execution in Chrome Trace Event Format.
+
+    Processors are lazy generators, and a stream item is pulled through the
+    whole pipe on demand. That's why the tracer records a span every time an
+    item is requested from a processor's output stream. Since a processor
+    pulls items from the previous processor (or from a nested pipe) while
+    producing its own, spans naturally nest into each other by time, and
+    tools like Perfetto or chrome://tracing render them as a call tree.
+    """
+
+    def __init__(self):
+        self._events = []
+        self._metrics = {}
+        self._pid = os.getpid()
+        self._epoch = time.perf_counter_ns()
+
+    @property
+    def events(self):
+        return self._events
+
+    def trace(self, name, stream):
+        """Wrap a given stream and record a span per item it produces."""
+
+        stream = iter(stream)
+
+        while True:
+            start = time.perf_counter_ns()
+            try:
+                item = next(stream)
+            except StopIteration:
+                self._record(name, start, {})
+                return
+            except Exception as exc:
+                self._record(name, start, {"error": repr(exc)})
+                raise
+
+            self._record(name, start, {"source": str(item["source"])} if "source" in item else {})
+            yield item
+
+    def metric(self, name, value):
+        """Record a counter event with an accumulated metric value."""
+
+        self._metrics[name] = self._metrics.get(name, 0) + value
+        self._events.append(
+            {
+                "name": name,
+                "cat": "metric",
+                "ph": "C",
+                "ts": (time.perf_counter_ns() - self._epoch) / 1000,
+                "pid": self._pid,
+                "args": {name: self._metrics[name]},
+            }
+        )
+
+    def dump(self, fp):
+        json.dump({"traceEvents": self._events, "displayTimeUnit": "ms"}, fp)
+
+    def _record(self, name, start, args):
+        end = time.perf_counter_ns()
+
+        # Complete events ("ph": "X") are used because they carry both a
+        # timestamp and a duration, and thus there's no need to match begin
+        # and end events. The format expects timestamps in microseconds.
+        self._events.append(
+            {
+                "name": name,
+                "cat": "processor",
+                "ph": "X",
+                "ts": (start - self._epoch) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+
+class Progress:
+    """Render build progress to a given stream.
+
+    Printing a line per item is expensive for large builds, both in terms of
+    I/O and formatting, and produces enormous logs. That's why the progress
+    is rendered at a fixed rate instead: a line with a number of built items,
+    a throughput, an estimated remaining time (if processors report how many
+    items are expected), and a number of items produced by every processor.
+    """
+
+    def __init__(self, stream, *, live=True, interval=None):
+        self._stream = stream
+        self._live = live
+        self._isatty = stream.isatty()
+
+        # Redrawing a line in-place is cheap, so a terminal can be refreshed
+        # often. Otherwise (e.g. CI logs), every refresh produces a new line,
+        # and hence we refresh rarely in order to keep logs readable.
+        if interval is None:
+            interval = 0.1 if self._isatty else 10.0
+
+        self._interval = interval
+        self._started = self._refreshed = time.monotonic()
+        self._rendered = False
+        self._done = 0
+        self._counters = {}
+        self._metrics = {}
+
+    def trace(self, name, stream):
+        """Wrap a given stream and count items it produces."""
+
+        for item in stream:
+            self._counters[name] = self._counters.get(name, 0) + 1
+            self._refresh()
+            yield item
+
+    def metric(self, name, value):
+        self._metrics[name] = self._metrics.get(name, 0) + value
+
+    def advance(self):
+        """Mark one more item as built."""
+
+        self._done += 1
+        self._refresh()
+
+    def clear(self):
+        """Erase a progress line, so other output doesn't interleave with it."""
+
+        if self._rendered and self._isatty:
+            self._stream.write("\r\x1b[K")
+            self._stream.flush()
+        self._rendered = False
+
+    def finish(self):
+        """Print a summary of the build."""
+
+        elapsed = time.monotonic() - self._started
+        self.clear()
+
+        self._stream.write(
+            f"Built {self._done} items in {elapsed:.1f}s"
+            f" ({self._rate(elapsed):.1f} items/s),"
+            f" {self._metrics.get('bytes_written', 0)} bytes written\n"
+        )
+        self._stream.flush()
+
+    def _rate(self, elapsed):
+        return self._done / elapsed if elapsed > 0 else 0.0
+
+    def _refresh(self):
+        if not self._live:
+            return
+
+        now = time.monotonic()
+        if now - self._refreshed < self._interval:
+            return
+        self._refreshed = now
+        self._rendered = True
+
+        elapsed = now - self._started
+        rate = self._rate(elapsed)
+        expected = self._metrics.get("expected")
+
+        parts = [f"{self._done} items", f"{rate:.1f} items/s"]
+        if expected:
+            parts[0] = f"{self._done}/{expected} items"
+
+            if rate and expected > self._done:
+                parts.append(f"ETA {(expected - self._done) / rate:.0f}s")
+
+        if self._counters:
+            parts.append(", ".join(f"{name}: {count}" for name, count in self._counters.items()))
+
+        line = " | ".join(parts)
+
+        if self._isatty:
+            self._stream.write(f"\r{line}\x1b[K")
+        else:
+            self._stream.write(f"{line}\n")
+        self._stream.flush()
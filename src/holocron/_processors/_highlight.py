@@ -0,0 +1,98 @@
+"""Syntax highlighting cache shared by markup processors."""
+
+import contextlib
+import contextvars
+import functools
+import threading
+
+import pygments.lexers
+import pygments.util
+
+from ._misc import FileCache
+
+
+@functools.cache
+def get_lexer(name):
+    """Return a lexer by a given name, or None if there's no such lexer."""
+
+    # Looking up a lexer by name walks the whole Pygments registry, which is
+    # surprisingly expensive given that code blocks of a site are written in a
+    # handful of languages. Lexers are stateless, so we can reuse them.
+    try:
+        return pygments.lexers.get_lexer_by_name(name)
+    except pygments.util.ClassNotFound:
+        return None
+
+
+class HighlightCache:
+    """Cache of highlighted code, in memory and optionally on disk.
+
+    Highlighting is one of the most expensive operations of a build, and
+    documentation sites are full of repeated code samples. Results are keyed
+    by a language, code and formatter options, and hence can be shared across
+    processors of an application and, if a path is given, across builds.
+    """
+
+    def __init__(self, path=None):
+        self._memory = {}
+        self._lock = threading.Lock()
+        self._files = FileCache(path) if path else None
+
+    def key(self, language, code, options):
+        return FileCache.key(language or "", options, code)
+
+    def get(self, key):
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+
+        if self._files and (value := self._files.get(key)) is not None:
+            value = value.decode("UTF-8")
+            with self._lock:
+                self._memory[key] = value
+            return value
+
+        return None
+
+    def set(self, key, value):
+        with self._lock:
+            self._memory[key] = value
+
+        if self._files:
+            self._files.set(key, value.encode("UTF-8"))
+
+    def highlight(self, code, language, options, highlight):
+        """Return cached highlighted code, or highlight it with a given function."""
+
+        key = self.key(language, code, options)
+
+        if (value := self.get(key)) is None:
+            value = highlight()
+            self.set(key, value)
+        return value
+
+
+def resource(app, path=None):
+    """Return a highlight cache shared by processors of a given application."""
+
+    return app.resource(("highlight", path), functools.partial(HighlightCache, path))
+
+
+_current_cache = contextvars.ContextVar("highlight_cache", default=None)
+
+
+@contextlib.contextmanager
+def using(cache):
+    """Make a given cache current within the context."""
+
+    token = _current_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _current_cache.reset(token)
+
+
+def current():
+    """Return a cache made current by :func:`using`, if any."""
+
+    return _current_cache.get()
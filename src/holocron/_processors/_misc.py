@@ -1,10 +1,17 @@
 """Various miscellaneous functions to make code easier to read & write."""
 
+import collections
 import collections.abc
+import concurrent.futures
+import contextlib
 import copy
 import functools
+import hashlib
 import inspect
 import logging
+import os
+import pathlib
+import tempfile
 import urllib.parse
 
 import jsonpointer
@@ -39,6 +46,93 @@ def resolve_json_references(value, context, *, keep_unknown=True):
     return _do_resolve(value)
 
 
+def write_atomic(path, data):
+    """Write a given string or bytes to a file at a given path atomically.
+
+    Data is written to a temporary file in the same directory first, and then
+    the file is moved to its place. So readers, including subsequent builds
+    if this one is interrupted, never see a partially written file. The name
+    of the temporary file is unique, so concurrent writers do not collide.
+    """
+
+    if isinstance(data, str):
+        data = data.encode("UTF-8")
+
+    fd, tmp = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)),
+        prefix=f".{os.path.basename(path)}.",
+        suffix=".tmp",
+    )
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
+def map_ordered(function, iterable, workers):
+    """Apply a function to every value on a thread pool, preserving order.
+
+    Values are consumed lazily, and the number of values being processed
+    ahead of the consumer is bounded by twice the number of workers, so the
+    memory usage is under control even for large streams. Results are yielded
+    in the original order in order to keep builds reproducible.
+    """
+
+    if workers == 1:
+        yield from map(function, iterable)
+        return
+
+    executor = concurrent.futures.ThreadPoolExecutor(workers)
+    pending = collections.deque()
+
+    try:
+        for value in iterable:
+            pending.append(executor.submit(function, value))
+
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+class FileCache:
+    """Cache of bytes on disk, persisted between builds.
+
+    Entries are keyed by a digest of given parts, so callers can key them by
+    whatever the cached value depends on, and are written atomically, so an
+    interrupted build never leaves a corrupted entry behind.
+    """
+
+    def __init__(self, path):
+        self._path = pathlib.Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(*parts):
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("UTF-8") if isinstance(part, str) else part)
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key):
+        try:
+            return self._path.joinpath(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def set(self, key, value):
+        write_atomic(self._path.joinpath(key), value)
+
+
 class parameters:
     def __init__(self, *, fallback=None, jsonschema=None):
         self._fallback = fallback or {}
@@ -8,16 +8,52 @@ import holocron
 from ._misc import parameters
 
 
+def _destination(save_as, page):
+    save_as = pathlib.Path(save_as)
+
+    # The first page is the archive entry point, and hence is saved as is,
+    # while the others are saved as 'page/N/index.html' next to it.
+    if page == 1:
+        return save_as
+    return save_as.parent.joinpath("page", str(page), save_as.name)
+
+
+def _createpage(app, template, save_as, page, items, *, last):
+    baseurl = app.metadata["url"]
+
+    def url(page):
+        destination = _destination(save_as, page)
+        return holocron.WebSiteItem({"destination": destination, "baseurl": baseurl}).url
+
+    return holocron.WebSiteItem(
+        {
+            "source": pathlib.Path("archive://", _destination(save_as, page)),
+            "destination": _destination(save_as, page),
+            "template": template,
+            "items": items,
+            "page": page,
+            "previous": url(page - 1) if page > 1 else None,
+            "next": url(page + 1) if not last else None,
+            "baseurl": baseurl,
+        }
+    )
+
+
 @parameters(
     jsonschema={
         "type": "object",
         "properties": {
             "template": {"type": "string"},
             "save_as": {"type": "string"},
+            "per_page": {"type": "integer", "minimum": 1},
         },
     }
 )
-def process(app, stream, *, template="archive.j2", save_as="index.html"):
+def process(app, stream, *, template="archive.j2", save_as="index.html", per_page=None):
+    if per_page is not None:
+        yield from _paginate(app, stream, template, save_as, per_page)
+        return
+
     passthrough, stream = itertools.tee(stream)
 
     index = holocron.WebSiteItem(
@@ -32,3 +68,21 @@ def process(app, stream, *, template="archive.j2", save_as="index.html"):
 
     yield from passthrough
     yield index
+
+
+def _paginate(app, stream, template, save_as, per_page):
+    page, items = 1, []
+
+    # A page is produced as soon as the first item of the next page arrives,
+    # since only then we know whether there's a next page to link to. Thus,
+    # no more than one page of items is held at a time no matter how long
+    # the stream is. Pages follow the order of items in the stream.
+    for item in stream:
+        if len(items) == per_page:
+            yield _createpage(app, template, save_as, page, items, last=False)
+            page, items = page + 1, []
+
+        items.append(item)
+        yield item
+
+    yield _createpage(app, template, save_as, page, items, last=True)
@@ -1,7 +1,11 @@
 """Convert CommonMark into HTML."""
 
+import collections
+import concurrent.futures
+import functools
 import json
 import logging
+import os
 import subprocess
 
 import markdown_it
@@ -9,13 +13,12 @@ import markdown_it.renderer
 import markdown_it.token
 import pygments
 import pygments.formatters.html
-import pygments.lexers
-import pygments.util
 from mdit_py_plugins.container import container_plugin
 from mdit_py_plugins.deflist import deflist_plugin
 from mdit_py_plugins.footnote import footnote_plugin
 
-from ._misc import parameters
+from . import _highlight
+from ._misc import FileCache, parameters
 
 _LOGGER = logging.getLogger("holocron")
 
@@ -28,18 +31,30 @@ class HolocronRendererHTML(markdown_it.renderer.RendererHTML):
     def fence(self, tokens, idx, options, env) -> str:
         token = tokens[idx]
 
-        match token.info.split(maxsplit=1):
-            case [_, params]:
-                params = json.loads(params)
-                if "exec" in params:
-                    standard_input = token.content.encode("UTF-8")
-                    standard_output = _exec_pipe(params["exec"], standard_input)
-                    return standard_output.decode("UTF-8")
+        # Commands of exec fences are dispatched in advance, with a timeout
+        # and a cache, so they run concurrently, and we only need to wait for
+        # their results here.
+        if "exec" in token.meta:
+            return token.meta["exec"].result().decode("UTF-8")
 
         return super().fence(tokens, idx, options, env)
 
 
-def _exec_pipe(args: list[str], input_: bytes, timeout: int = 1000) -> bytes:
+def _exec_params(token):
+    match token.info.split(maxsplit=1):
+        case [_, params]:
+            params = json.loads(params)
+            if "exec" in params:
+                return params
+    return None
+
+
+def _exec_pipe(args: list[str], input_: bytes, timeout: int = 1000, cache=None) -> bytes:
+    if cache is not None:
+        key = cache.key(json.dumps(args), input_)
+        if (output := cache.get(key)) is not None:
+            return output
+
     try:
         completed_process = subprocess.run(
             args,
@@ -52,10 +67,15 @@ def _exec_pipe(args: list[str], input_: bytes, timeout: int = 1000) -> bytes:
         return b"timed out executing the command"
     except subprocess.CalledProcessError as exc:
         return exc.stderr
+
+    # Only successful results are cached, since failures may be caused by
+    # environment (e.g. missing executable) and may be fixed by next build.
+    if cache is not None:
+        cache.set(key, completed_process.stdout)
     return completed_process.stdout
 
 
-def _pygmentize(code: str, language: str, _: str) -> str:
+def _pygmentize(code: str, language: str, _: str, cache=None) -> str:
     if not language:
         return code
 
@@ -65,19 +85,96 @@ def _pygmentize(code: str, language: str, _: str) -> str:
         formatter = pygments.formatters.html.HtmlFormatter(nowrap=True)
         _pygmentize.formatter = formatter
 
-    try:
-        lexer = pygments.lexers.get_lexer_by_name(language)
-    except pygments.util.ClassNotFound:
+    lexer = _highlight.get_lexer(language)
+    if lexer is None:
         _LOGGER.warning("pygmentize: no such langauge: '%s'", language)
         return code
 
-    return pygments.highlight(code, lexer, formatter)
+    if cache is None:
+        return pygments.highlight(code, lexer, formatter)
+
+    return cache.highlight(
+        code,
+        language,
+        "commonmark:nowrap",
+        functools.partial(pygments.highlight, code, lexer, formatter),
+    )
+
+
+def _commonmark(
+    pygmentize, strikethrough, table, footnote, admonition, definition, highlight_cache
+):
+    commonmark = markdown_it.MarkdownIt(renderer_cls=HolocronRendererHTML)
+
+    if pygmentize:
+        commonmark.options.highlight = functools.partial(_pygmentize, cache=highlight_cache)
+    if strikethrough:
+        commonmark.enable("strikethrough")
+    if table:
+        commonmark.enable("table")
+    if footnote:
+        commonmark.use(footnote_plugin)
+    if admonition:
+        commonmark.use(container_plugin, "warning")
+        commonmark.use(container_plugin, "note")
+    if definition:
+        commonmark.use(deflist_plugin)
+
+    return commonmark
+
+
+def _compact(key, value):
+    # Most token fields are either empty or have default values, so we strip
+    # them away as well as fields that are only meaningful to the renderer,
+    # in order to keep the token stream small and serializable.
+    return bool(value) and key not in {"map", "level", "block", "hidden", "meta"}
+
+
+def _text(inline):
+    # Line breaks separate words just like spaces do, yet they are separate
+    # tokens without content, so we have to substitute them with spaces.
+    return "".join(
+        " " if child.type in {"softbreak", "hardbreak"} else child.content
+        for child in inline.children or []
+        if child.type in {"text", "code_inline", "softbreak", "hardbreak"}
+    )
+
+
+def _outline(tokens):
+    return [
+        {"level": int(token.tag[1]), "title": _text(tokens[idx + 1])}
+        for idx, token in enumerate(tokens)
+        if token.type == "heading_open"
+    ]
+
+
+def _excerpt(tokens):
+    for idx, token in enumerate(tokens):
+        if token.type == "paragraph_open" and token.level == 0:
+            for end in range(idx, len(tokens)):
+                if tokens[end].type == "paragraph_close" and tokens[end].level == 0:
+                    return tokens[idx : end + 1]
+    return []
+
+
+def _wordcount(tokens):
+    return sum(len(_text(token).split()) for token in tokens if token.type == "inline")
 
 
 @parameters(
     jsonschema={
         "type": "object",
-        "properties": {"pygmentize": {"type": "boolean"}},
+        "properties": {
+            "pygmentize": {"type": "boolean"},
+            "highlight_cache": {"type": "string", "format": "path"},
+            "tokens": {"type": "boolean"},
+            "outline": {"type": "boolean"},
+            "excerpt": {"type": "boolean"},
+            "wordcount": {"type": "boolean"},
+            "exec_workers": {"type": "integer", "minimum": 1},
+            "exec_timeout": {"type": "number", "exclusiveMinimum": 0},
+            "exec_cache": {"type": "string", "format": "path"},
+        },
     }
 )
 def process(
@@ -91,27 +188,58 @@ def process(
     footnote=False,
     admonition=False,
     definition=False,
+    exec_workers=None,
+    exec_timeout=1000,
+    exec_cache=None,
+    highlight_cache=None,
+    tokens=False,
+    outline=False,
+    excerpt=False,
+    wordcount=False,
 ):
-    commonmark = markdown_it.MarkdownIt(renderer_cls=HolocronRendererHTML)
+    # The parser doesn't keep any per-document state, so it's shared between
+    # invocations that set it up the same way, since enabling plugins and
+    # compiling their rules is not free.
+    highlight_cache = _highlight.resource(app, highlight_cache)
+    options = (pygmentize, strikethrough, table, footnote, admonition, definition, highlight_cache)
+    commonmark = app.resource(("commonmark", *options), functools.partial(_commonmark, *options))
 
-    if pygmentize:
-        commonmark.options.highlight = _pygmentize
-    if strikethrough:
-        commonmark.enable("strikethrough")
-    if table:
-        commonmark.enable("table")
-    if footnote:
-        commonmark.use(footnote_plugin)
-    if admonition:
-        commonmark.use(container_plugin, "warning")
-        commonmark.use(container_plugin, "note")
-    if definition:
-        commonmark.use(deflist_plugin)
+    # The 'tokens' argument name is reused for parsed tokens down below.
+    expose_tokens = tokens
+
+    exec_workers = exec_workers or os.cpu_count() or 1
+    exec_cache = FileCache(exec_cache) if exec_cache else None
+
+    # Most documents have no exec fences at all, so the pool is created on
+    # the first exec fence rather than on every invocation.
+    executor = None
 
-    for item in stream:
+    def submit(*args):
+        nonlocal executor
+
+        if executor is None:
+            executor = concurrent.futures.ThreadPoolExecutor(exec_workers)
+        return executor.submit(_exec_pipe, *args)
+
+    def parse(item):
         env = {}
         tokens = commonmark.parse(item["content"], env)
 
+        # Exec fences run external commands that may take a while, and thus
+        # are dispatched to a pool as soon as a document is parsed, so they
+        # run concurrently within a document as well as across documents.
+        for token in tokens:
+            if token.type == "fence" and (params := _exec_params(token)):
+                token.meta["exec"] = submit(
+                    params["exec"],
+                    token.content.encode("UTF-8"),
+                    params.get("timeout", exec_timeout),
+                    exec_cache,
+                )
+
+        return item, tokens, env
+
+    def render(item, tokens, env):
         # Here's where the commonmark processor is being "smart". If the stream
         # item doesn't have a title set and the commonmark content starts with
         # a heading, the heading is considered the item's title and is removed
@@ -126,6 +254,40 @@ def process(
             item["title"] = tokens[1].content
             tokens = tokens[3:]
 
+        # Later stages (e.g. table of contents, search index, reading time)
+        # may need document structure, and since we have already parsed the
+        # document, it's way cheaper to expose it than to parse HTML again.
+        if expose_tokens:
+            item["tokens"] = [token.as_dict(as_upstream=False, filter=_compact) for token in tokens]
+        if outline:
+            item["outline"] = _outline(tokens)
+        if excerpt:
+            item["excerpt"] = commonmark.renderer.render(_excerpt(tokens), commonmark.options, env)
+        if wordcount:
+            item["wordcount"] = _wordcount(tokens)
+
         item["content"] = commonmark.renderer.render(tokens, commonmark.options, env)
         item["destination"] = item["destination"].with_suffix(".html")
-        yield item
+        return item
+
+    def isready(tokens):
+        return all(token.meta["exec"].done() for token in tokens if "exec" in token.meta)
+
+    # Documents are parsed ahead of rendering, so commands of exec fences of
+    # following documents are running while we wait for the current one. Yet
+    # a document is rendered as soon as its commands are done, so documents
+    # without exec fences are not held at all.
+    pending = collections.deque()
+
+    try:
+        for item in stream:
+            pending.append(parse(item))
+
+            while pending and (len(pending) > exec_workers or isready(pending[0][1])):
+                yield render(*pending.popleft())
+
+        while pending:
+            yield render(*pending.popleft())
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
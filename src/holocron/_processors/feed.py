@@ -1,5 +1,6 @@
 """Generate RSS/Atom feed (with extensions if needed)."""
 
+import functools
 import importlib.metadata
 import itertools
 import pathlib
@@ -78,7 +79,12 @@ def process(
     feed_generator.link(_resolvefeed("link"), replace=True)
     feed_generator.category(_resolvefeed("category"), replace=True)
     feed_generator.contributor(_resolvefeed("contributor"), replace=True)
-    _generator_version = importlib.metadata.version("holocron")
+    # Feed generators accumulate entries and thus can't be shared between
+    # invocations, but looking up the installed version scans distributions
+    # metadata, so it's done once per application.
+    _generator_version = app.resource(
+        "holocron-version", functools.partial(importlib.metadata.version, "holocron")
+    )
     feed_generator.generator(
         generator=f"Holocron/v{_generator_version}",
         version=_generator_version,
@@ -1,51 +1,80 @@
 """Parse YAML front matter and set its values as item"s properties."""
 
 import collections.abc
-import re
+import json
+import logging
 
-import toml
 import yaml
 
 from ._misc import parameters
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import toml as tomllib
+
+_logger = logging.getLogger("holocron")
+
+# Opening and closing delimiters of frontmatter. JSON frontmatter is a JSON
+# object, and thus it's delimited by the object's own braces, which must be
+# put back before parsing.
 _DELIMITERS = {
-    "toml": r"+++",
-    "yaml": r"---",
+    "json": ("{", "}"),
+    "toml": ("+++", "+++"),
+    "yaml": ("---", "---"),
 }
 
+# LibYAML based loader is order of magnitude faster than the pure Python one,
+# yet it's an optional part of PyYAML and may not be available.
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 _LOADERS = {
-    "toml": toml.loads,
-    "yaml": yaml.safe_load,
+    "json": lambda text: json.loads("{\n" + text + "\n}"),
+    "toml": tomllib.loads,
+    "yaml": lambda text: yaml.load(text, Loader=_YAMLLoader),  # noqa: S506
 }
 
 
+def _split(content, opening, closing):
+    """Split content into frontmatter and the rest, or return None.
+
+    Frontmatter must start at the very beginning of content, and it ends at
+    the first line that consists of a delimiter. Only frontmatter is scanned,
+    so the cost doesn't depend on the size of content, and delimiter-like
+    lines later in content (e.g. horizontal rules) are left intact.
+    """
+
+    opening = opening + "\n"
+    closing = "\n" + closing + "\n"
+
+    if not content.startswith(opening):
+        return None
+
+    end = content.find(closing, len(opening))
+    if end == -1:
+        return None
+
+    return content[len(opening) : end], content[end + len(closing) :]
+
+
 @parameters(
     jsonschema={
         "type": "object",
         "properties": {
             "delimiter": {"type": "string"},
-            "format": {"type": "string", "enum": ["yaml", "toml"]},
+            "format": {"type": "string", "enum": ["yaml", "toml", "json"]},
             "overwrite": {"type": "boolean"},
         },
     }
 )
 def process(app, stream, *, format="yaml", delimiter=None, overwrite=True):
     loader = _LOADERS[format]
-    delimiter = re.escape(delimiter or _DELIMITERS[format])
-    re_frontmatter = re.compile(
-        rf"""
-        ^{delimiter}\n
-         (?P<frontmatter>.*)\n
-         {delimiter}\n
-         (?P<content>.*)
-        """,
-        re.DOTALL | re.VERBOSE,
-    )
+    opening, closing = (delimiter, delimiter) if delimiter else _DELIMITERS[format]
 
     for item in stream:
-        if match := re_frontmatter.match(item["content"]):
-            item["content"] = match.group("content")
-            frontmatter = loader(match.group("frontmatter"))
+        if parts := _split(item["content"], opening, closing):
+            frontmatter, item["content"] = parts
+            frontmatter = loader(frontmatter)
 
             if not isinstance(frontmatter, collections.abc.Mapping):
                 msg = "Frontmatter must be a mapping (i.e. key-value pairs), " "not arrays."
@@ -54,4 +83,12 @@ def process(app, stream, *, format="yaml", delimiter=None, overwrite=True):
             for key, value in frontmatter.items():
                 if overwrite or key not in item:
                     item[key] = value
+
+        # Items may be read partially (e.g. 'source' processor reads only
+        # heads of files in order to retrieve frontmatter), and if there's no
+        # frontmatter, it's worth letting know the head is too short.
+        elif item.get("partial"):
+            _logger.warning(
+                "frontmatter: not found in partially read item: '%s'", item.get("source")
+            )
         yield item
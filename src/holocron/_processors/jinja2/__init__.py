@@ -1,13 +1,109 @@
 """Render items using Jinja2 template engine."""
 
+import functools
+import logging
 import pathlib
+import re
 
 import jsonpointer
 
+import holocron
 import jinja2
 
 from .. import source
 from .._misc import parameters
+from ._fragmentcache import FragmentCacheExtension
+
+_COMPILED_DIR = "templates.compiled"
+
+_logger = logging.getLogger("holocron")
+
+
+def _environment(loader, **kwargs):
+    env = jinja2.Environment(
+        loader=loader,
+        extensions=[FragmentCacheExtension],
+        trim_blocks=True,
+        lstrip_blocks=True,
+        **kwargs,
+    )
+    env.filters["jsonpointer"] = jsonpointer.resolve_pointer
+    return env
+
+
+class _CompiledLoader(jinja2.ModuleLoader):
+    """Load precompiled templates unless their sources are newer.
+
+    A template that has been changed since its theme was compiled is not
+    found by the loader, so it's loaded from its source by the next loader.
+    """
+
+    def __init__(self, compiled, templates):
+        super().__init__(str(compiled))
+        self._compiled = pathlib.Path(compiled)
+        self._templates = pathlib.Path(templates)
+
+    def load(self, environment, name, globals=None):
+        module = self._compiled.joinpath(self.get_module_filename(name))
+
+        try:
+            outdated = self._templates.joinpath(name).stat().st_mtime > module.stat().st_mtime
+        except FileNotFoundError:
+            outdated = False
+
+        if outdated:
+            _logger.warning("jinja2: compiled template is outdated, using source: '%s'", name)
+            raise jinja2.TemplateNotFound(name)
+        return super().load(environment, name, globals)
+
+
+def _theme_loader(theme):
+    templates = pathlib.Path(theme, "templates")
+    compiled = pathlib.Path(theme, _COMPILED_DIR)
+
+    # Themes may be shipped with precompiled templates (see compile_theme()),
+    # in which case nothing needs to be compiled at all. Sources are still
+    # used for templates that are not precompiled or have been changed since.
+    if compiled.is_dir():
+        return jinja2.ChoiceLoader(
+            [_CompiledLoader(compiled, templates), jinja2.FileSystemLoader(str(templates))]
+        )
+    return jinja2.FileSystemLoader(str(templates))
+
+
+def _themes_environment(themes, bytecode_cache, fragment_cache):
+    # Lexing and compiling templates takes a good share of short builds, and
+    # templates rarely change between builds. So compiled templates may be
+    # cached on disk, and Jinja2 takes care of invalidating them once their
+    # sources change.
+    if bytecode_cache:
+        pathlib.Path(bytecode_cache).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(bytecode_cache)
+
+    env = _environment(
+        jinja2.ChoiceLoader([_theme_loader(theme) for theme in themes]),
+        bytecode_cache=bytecode_cache,
+    )
+    env.fragment_cache_path = fragment_cache
+    return env
+
+
+def compile_theme(theme):
+    """Precompile templates of a given theme into Python modules.
+
+    Compiled templates are written next to the theme templates, and are
+    picked up by the processor instead of the templates in subsequent runs,
+    unless the templates are changed afterwards. Hence the theme should be
+    compiled again once its templates are changed.
+    """
+
+    templates = pathlib.Path(theme, "templates")
+
+    if not templates.is_dir():
+        msg = f"Cannot compile a theme, no templates found: '{theme}'"
+        raise RuntimeError(msg)
+    env = _environment(jinja2.FileSystemLoader(str(templates)))
+    env.compile_templates(str(pathlib.Path(theme, _COMPILED_DIR)), zip=None)
 
 
 @parameters(
@@ -17,10 +113,23 @@ from .._misc import parameters
             "template": {"type": "string"},
             "context": {"type": "object"},
             "themes": {"type": "array", "items": {"type": "string"}},
+            "bytecode_cache": {"type": "string", "format": "path"},
+            "fragment_cache": {"type": "string", "format": "path"},
+            "streaming": {"type": "boolean"},
         },
     }
 )
-def process(app, stream, *, template="item.j2", context=None, themes=None):
+def process(
+    app,
+    stream,
+    *,
+    template="item.j2",
+    context=None,
+    themes=None,
+    bytecode_cache=None,
+    fragment_cache=None,
+    streaming=False,
+):
     # Because it is easier to write themes if we assume that 'theme' variable
     # is always defined in context of template, let's ensure it is always
     # defined indeed. Frankly, I'm not exactly sure about this line and it may
@@ -31,22 +140,57 @@ def process(app, stream, *, template="item.j2", context=None, themes=None):
     if themes is None:
         themes = [str(pathlib.Path(__file__).parent / "theme")]
 
-    env = jinja2.Environment(
-        loader=jinja2.ChoiceLoader(
-            [jinja2.FileSystemLoader(str(pathlib.Path(theme, "templates"))) for theme in themes]
-        ),
-        trim_blocks=True,
-        lstrip_blocks=True,
+    # A pipe may render items with the same themes several times (e.g. posts,
+    # archive, tag pages). Sharing the environment means templates are loaded
+    # and compiled once per application, rather than once per invocation.
+    # Jinja2 still reloads templates once their sources change.
+    env = app.resource(
+        ("jinja2", tuple(themes), bytecode_cache, fragment_cache),
+        functools.partial(_themes_environment, themes, bytecode_cache, fragment_cache),
     )
-    env.filters["jsonpointer"] = jsonpointer.resolve_pointer
 
     for item in stream:
-        render = env.get_template(item.get("template", template)).render
-        item["content"] = render(item=item, metadata=app.metadata, **context)
+        template_ = env.get_template(item.get("template", template))
+
+        # Huge pages (e.g. an archive of all posts) take a lot of memory if
+        # rendered into a string. In streaming mode, content is an iterator
+        # of rendered chunks instead, and rendering is deferred until the
+        # content is consumed (e.g. chunk by chunk into a file by 'save').
+        # Since the item's content is replaced before then, templates are
+        # given a snapshot of the item as it was before rendering.
+        if streaming:
+            item["content"] = template_.generate(
+                item=holocron.Item(item), metadata=app.metadata, **context
+            )
+        else:
+            item["content"] = template_.render(item=item, metadata=app.metadata, **context)
         yield item
 
     # Themes may optionally come with various statics (e.g. css, images) they
     # depend on. That's why we need to inject these statics to the stream;
-    # otherwise, rendered items may look improperly.
+    # otherwise, rendered items may look improperly. Statics are produced as
+    # file references, since they are passed through as is, and only once
+    # per pipe invocation, since a pipe may render items several times. If
+    # themes have statics with the same destination, the first theme wins,
+    # just like with templates.
+    walked = app.resource("jinja2:themes", set, per_invoke=True)
+    emitted = app.resource("jinja2:statics", set, per_invoke=True)
+
     for theme in themes:
-        yield from source.process(app, [], path=theme, pattern=r"static/")
+        if theme in walked:
+            continue
+        walked.add(theme)
+
+        # Statics already produced by other themes are excluded from a walk,
+        # so they are neither produced nor reported as expected again.
+        exclude = ["/" + _escape_glob(destination.as_posix()) for destination in emitted]
+
+        for item in source.process(
+            app, [], path=theme, pattern=r"static/", exclude=exclude, lazy=True
+        ):
+            emitted.add(item["destination"])
+            yield item
+
+
+def _escape_glob(path):
+    return re.sub(r"[*?\[]", r"[\g<0>]", path)
@@ -0,0 +1,101 @@
+"""Cache rendered template fragments."""
+
+import collections.abc
+import hashlib
+import json
+import pathlib
+import threading
+import time
+
+import jinja2.ext
+from jinja2 import nodes
+
+from .._misc import write_atomic
+
+
+class FragmentCacheExtension(jinja2.ext.Extension):
+    """Cache rendered fragments of templates.
+
+    Themes often render the same expensive fragments on every page (e.g. a
+    sidebar with recent posts or a tag cloud). The extension adds a tag that
+    renders a fragment once per key, and reuses it for the rest of a build:
+
+        {% cache "sidebar" %}...{% endcache %}
+        {% cache ("sidebar", item), 3600 %}...{% endcache %}
+
+    Keys may be arbitrary values, including items, which are fingerprinted by
+    their content. If the environment has 'fragment_cache_path' set, rendered
+    fragments are also persisted between builds, and an optional TTL (in
+    seconds) limits how long persisted fragments are reused.
+    """
+
+    tags = frozenset({"cache"})
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache_path=None)
+        self._fragments = {}
+        self._lock = threading.Lock()
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+
+        key = parser.parse_expression()
+        ttl = nodes.Const(None)
+
+        if parser.stream.skip_if("comma"):
+            ttl = parser.parse_expression()
+
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+
+        # The fragment itself is a part of a key, so the same key used for
+        # different fragments doesn't mean the same cache. Node reprs contain
+        # node fields only, and hence are stable between builds.
+        fragment = hashlib.sha256(repr(body).encode("UTF-8")).hexdigest()
+        keys = [nodes.Const(f"{parser.name}:{fragment}"), key]
+        call = self.call_method("_render", [nodes.List(keys), ttl])
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _render(self, keys, ttl, caller):
+        key = _fingerprint(keys)
+
+        with self._lock:
+            if key in self._fragments:
+                return self._fragments[key]
+
+        path = self.environment.fragment_cache_path
+
+        if path is not None:
+            path = pathlib.Path(path, key)
+            try:
+                if ttl is None or time.time() - path.stat().st_mtime < ttl:
+                    fragment = path.read_text(encoding="UTF-8")
+                    with self._lock:
+                        self._fragments[key] = fragment
+                    return fragment
+            except FileNotFoundError:
+                pass
+
+        fragment = caller()
+
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(path, fragment)
+
+        with self._lock:
+            self._fragments[key] = fragment
+        return fragment
+
+
+def _fingerprint(value):
+    serialized = json.dumps(value, sort_keys=True, default=_serialize)
+    return hashlib.sha256(serialized.encode("UTF-8")).hexdigest()
+
+
+def _serialize(value):
+    # Keys are usually either strings or items, and since items are mappings
+    # with values like paths and datetimes, we serialize items as mappings and
+    # everything else by its string representation.
+    if isinstance(value, collections.abc.Mapping):
+        return dict(value)
+    return str(value)
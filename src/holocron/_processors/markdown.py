@@ -1,10 +1,21 @@
 """Convert Markdown into HTML."""
 
+import contextlib
+import functools
+import json
+import logging
+import queue
 import re
+import types
 
 import markdown
+import markdown.extensions.codehilite
+import markdown.extensions.fenced_code
 
-from ._misc import parameters
+from . import _highlight
+from ._misc import map_ordered, parameters
+
+_logger = logging.getLogger("holocron")
 
 _top_heading_re = re.compile(
     (
@@ -24,25 +35,135 @@ _top_heading_re = re.compile(
 )
 
 
-@parameters(
-    jsonschema={
-        "type": "object",
-        "properties": {
-            "extensions": {
-                "type": "object",
-                "propertyNames": {"pattern": r"^markdown\.extensions\..*"},
-            }
-        },
-    }
-)
-def process(app, stream, *, extensions=None):
-    markdown_ = markdown.Markdown(
+class _CodeHilite(markdown.extensions.codehilite.CodeHilite):
+    def hilite(self, shebang=True):  # noqa: FBT002
+        cache = _highlight.current()
+        if cache is None:
+            return super().hilite(shebang)
+
+        formatter = self.pygments_formatter
+        options = repr(
+            (
+                "markdown",
+                shebang,
+                self.use_pygments,
+                self.guess_lang,
+                self.lang_prefix,
+                formatter if isinstance(formatter, str) else formatter.__qualname__,
+                sorted(self.options.items()),
+            )
+        )
+        return cache.highlight(
+            self.src,
+            self.lang,
+            options,
+            functools.partial(super().hilite, shebang),
+        )
+
+
+def _with_codehilite(function):
+    # Both codehilite and fenced_code processors highlight code by
+    # instantiating 'CodeHilite' from their module globals, and provide no way
+    # to pass an alternative class. So we make a copy of a processor function
+    # that looks globals up in a copy of its module globals, where 'CodeHilite'
+    # is our subclass, leaving the modules themselves intact.
+    copy = types.FunctionType(
+        function.__code__,
+        {**function.__globals__, "CodeHilite": _CodeHilite},
+        function.__name__,
+        function.__defaults__,
+        function.__closure__,
+    )
+    copy.__kwdefaults__ = function.__kwdefaults__
+    return functools.update_wrapper(copy, function)
+
+
+class _HiliteTreeprocessor(markdown.extensions.codehilite.HiliteTreeprocessor):
+    run = _with_codehilite(markdown.extensions.codehilite.HiliteTreeprocessor.run)
+
+
+class _FencedBlockPreprocessor(markdown.extensions.fenced_code.FencedBlockPreprocessor):
+    run = _with_codehilite(markdown.extensions.fenced_code.FencedBlockPreprocessor.run)
+
+
+class _HighlightCacheExtension(markdown.Extension):
+    """Make code highlighting consult a highlight cache.
+
+    The extension has to be registered after all other extensions, since it
+    alters processors registered by codehilite and fenced_code extensions,
+    so they highlight code via a cache made current by a markdown processor.
+    Without a current cache, they behave exactly the same.
+    """
+
+    _processors = (
+        ("treeprocessors", "hilite", _HiliteTreeprocessor),
+        ("preprocessors", "fenced_code_block", _FencedBlockPreprocessor),
+    )
+
+    def extendMarkdown(self, md):
+        for registry, name, subclass in self._processors:
+            if name not in getattr(md, registry):
+                continue
+
+            processor = getattr(md, registry)[name]
+
+            # Our subclasses only work as long as upstream processors look
+            # 'CodeHilite' up in their module globals. If that's not the case
+            # (e.g. Python-Markdown has changed, or the processor has been
+            # replaced by another extension), we'd rather highlight without a
+            # cache than silently produce something different.
+            (base,) = subclass.__bases__
+            if type(processor) is not base or "CodeHilite" not in base.run.__code__.co_names:
+                _logger.warning("markdown: highlight cache is not supported by '%s'", name)
+                continue
+
+            # The processor is already set up and registered with a proper
+            # priority, so we only change its class to ours that highlights
+            # code the same way, yet via a cache.
+            processor.__class__ = subclass
+
+
+class _ConverterPool:
+    """Pool of Markdown converters.
+
+    Markdown converters are not thread-safe, and extensions (e.g. footnotes,
+    toc) keep per-document state in them until reset. Creating a converter
+    per document is expensive though, since every extension is loaded and
+    registered anew. So converters are created on demand, one per thread
+    converting concurrently, and are reset before they are reused.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._idle = queue.SimpleQueue()
+
+    @contextlib.contextmanager
+    def acquire(self):
+        try:
+            converter = self._idle.get_nowait()
+        except queue.Empty:
+            converter = self._factory()
+
+        try:
+            yield converter
+        finally:
+            converter.reset()
+            self._idle.put(converter)
+
+
+def _converter(extensions):
+    return markdown.Markdown(
         # No one use pure Markdown nowadays, so let's enhance it with some
         # popular and widely used extensions such as tables, footnotes and
         # syntax highlighting.
-        extensions=list(extensions.keys())
-        if extensions is not None
-        else ["markdown.extensions.codehilite", "markdown.extensions.extra"],
+        extensions=[
+            *(
+                extensions.keys()
+                if extensions is not None
+                else ["markdown.extensions.codehilite", "markdown.extensions.extra"]
+            ),
+            _HighlightCacheExtension(),
+        ],
         extension_configs=extensions
         if extensions is not None
         else {
@@ -55,7 +176,32 @@ def process(app, stream, *, extensions=None):
         },
     )
 
-    for item in stream:
+
+@parameters(
+    jsonschema={
+        "type": "object",
+        "properties": {
+            "extensions": {
+                "type": "object",
+                "propertyNames": {"pattern": r"^markdown\.extensions\..*"},
+            },
+            "highlight_cache": {"type": "string", "format": "path"},
+            "workers": {"type": "integer", "minimum": 1},
+        },
+    }
+)
+def process(app, stream, *, extensions=None, highlight_cache=None, workers=1):
+    # Converters are reset between uses, so a pool is shared between
+    # invocations with the same extensions, since loading extensions and
+    # registering their processors is not free.
+    pool = app.resource(
+        ("markdown", json.dumps(extensions, sort_keys=True, default=repr)),
+        lambda: _ConverterPool(functools.partial(_converter, extensions)),
+    )
+
+    cache = _highlight.resource(app, highlight_cache)
+
+    def convert(item):
         match = _top_heading_re.match(item["content"])
 
         if match:
@@ -68,7 +214,12 @@ def process(app, stream, *, extensions=None):
             # priority, let's set 'title' iff it's not set.
             item["title"] = item.get("title", title)
 
-        item["content"] = markdown_.convert(item["content"])
+        with pool.acquire() as converter, _highlight.using(cache):
+            item["content"] = converter.convert(item["content"])
         item["destination"] = item["destination"].with_suffix(".html")
+        return item
 
-        yield item
+    # Items are converted on a thread pool, which pays off on interpreters
+    # without the GIL as well as with extensions that release it (e.g. ones
+    # that call external programs).
+    yield from map_ordered(convert, stream, workers)
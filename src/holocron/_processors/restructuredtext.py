@@ -1,7 +1,9 @@
 """Convert reStructuredText into HTML."""
 
-from docutils import nodes
-from docutils.core import publish_parts
+from docutils import io, nodes
+from docutils.core import Publisher
+from docutils.parsers import rst
+from docutils.readers import standalone
 from docutils.writers import html5_polyglot
 
 from ._misc import parameters
@@ -10,10 +12,15 @@ from ._misc import parameters
 @parameters(
     jsonschema={
         "type": "object",
-        "properties": {"settings": {"type": "object"}},
+        "properties": {
+            "settings": {"type": "object"},
+            "outline": {"type": "boolean"},
+            "docinfo": {"type": "boolean"},
+            "excerpt": {"type": "boolean"},
+        },
     }
 )
-def process(app, stream, *, settings=None):
+def process(app, stream, *, settings=None, outline=False, docinfo=False, excerpt=False):
     settings = dict(
         {
             # We need to start heading level with <h2> in case there are
@@ -37,18 +44,33 @@ def process(app, stream, *, settings=None):
         **(settings or {}),
     )
 
-    for item in stream:
-        # Writer is mutable so we can't share the same instance between
-        # conversions.
-        writer = html5_polyglot.Writer()
-
-        # Unfortunately we are not happy with out-of-box conversion to
-        # HTML. For instance, we want to see inline code to be wrapped
-        # into <code> tag rather than <span>. So we need to use custom
-        # translator to fit our needs.
-        writer.translator_class = _HTMLTranslator
+    # Unfortunately we are not happy with out-of-box conversion to HTML. For
+    # instance, we want to see inline code to be wrapped into <code> tag
+    # rather than <span>. So we need to use custom translator to fit our
+    # needs.
+    writer = html5_polyglot.Writer()
+    writer.translator_class = _HTMLTranslator
+
+    # Setting up a publisher means building an option parser, reading config
+    # files and resolving default settings of every component, which takes
+    # as long as converting a short document. Since settings are the same
+    # for every item, we set the publisher up once and reuse it. This is safe
+    # because a new document and a new translator are created per conversion,
+    # and writer parts are overwritten every time.
+    publisher = Publisher(
+        reader=standalone.Reader(),
+        parser=rst.Parser(),
+        writer=writer,
+        source_class=io.StringInput,
+        destination_class=io.StringOutput,
+    )
+    publisher.process_programmatic_settings(None, settings, None)
 
-        parts = publish_parts(item["content"], writer=writer, settings_overrides=settings)
+    for item in stream:
+        publisher.set_source(item["content"])
+        publisher.set_destination()
+        publisher.publish()
+        parts = writer.parts
 
         item["content"] = parts["fragment"].strip()
         item["destination"] = item["destination"].with_suffix(".html")
@@ -61,9 +83,54 @@ def process(app, stream, *, settings=None):
         if "title" not in item and parts.get("title"):
             item["title"] = parts["title"]
 
+        # Later stages (e.g. table of contents, feeds, search index) may need
+        # document structure, and since the doctree is still around, it's way
+        # cheaper to extract it than to parse HTML again.
+        if outline:
+            item["outline"] = _outline(publisher.document, settings["initial_header_level"])
+        if docinfo:
+            item["docinfo"] = _docinfo(publisher.document)
+        if excerpt:
+            item["excerpt"] = _excerpt(publisher.document)
+
         yield item
 
 
+def _outline(document, initial_header_level):
+    outline = []
+
+    def walk(node, level):
+        for section in node.children:
+            if isinstance(section, nodes.section):
+                outline.append({"level": level, "title": section.next_node(nodes.title).astext()})
+                walk(section, level + 1)
+
+    walk(document, initial_header_level)
+    return outline
+
+
+def _docinfo(document):
+    docinfo = {}
+
+    for node in document.findall(nodes.docinfo):
+        for field in node.children:
+            # Registered bibliographic fields (e.g. date, author) are turned
+            # into their own nodes, while others are kept as generic fields.
+            if isinstance(field, nodes.field):
+                docinfo[field[0].astext()] = field[1].astext()
+            else:
+                docinfo[field.tagname] = field.astext()
+
+    return docinfo
+
+
+def _excerpt(document):
+    for node in document.findall(nodes.paragraph):
+        if isinstance(node.parent, nodes.document | nodes.section):
+            return node.astext()
+    return ""
+
+
 class _HTMLTranslator(html5_polyglot.HTMLTranslator):
     """Translate reStructuredText nodes to HTML."""
 
@@ -1,6 +1,9 @@
 """Save items to a filesystem."""
 
+import contextlib
+import os
 import pathlib
+import shutil
 
 from ._misc import parameters
 
@@ -12,10 +15,11 @@ from ._misc import parameters
         "properties": {
             "to": {"type": "string", "format": "path"},
             "encoding": {"type": "string", "format": "encoding"},
+            "link": {"type": "boolean"},
         },
     },
 )
-def process(app, stream, *, to="_site", encoding="UTF-8"):
+def process(app, stream, *, to="_site", encoding="UTF-8", link=False):
     to = pathlib.Path(to)
 
     for item in stream:
@@ -24,10 +28,55 @@ def process(app, stream, *, to="_site", encoding="UTF-8"):
 
         # Content may be either bytes or string based on the type of content we
         # deal with (e.g. pictures, pages, etc), and therefore this content
-        # must be saved accordingly.
-        if isinstance(item["content"], str):
-            destination.write_text(item["content"], encoding=encoding)
+        # must be saved accordingly. Content may also be an iterator of string
+        # chunks (e.g. a page rendered in streaming mode), in which case it's
+        # written and encoded chunk by chunk in order to never hold the whole
+        # content in memory, or a path to a file to be copied (e.g. statics
+        # produced by 'source' in lazy mode).
+        if isinstance(item["content"], pathlib.Path):
+            _copyfile(item["content"], destination, link=link)
         else:
-            destination.write_bytes(item["content"])
+            _unlink(destination)
 
+            if isinstance(item["content"], str):
+                destination.write_text(item["content"], encoding=encoding)
+            elif isinstance(item["content"], bytes):
+                destination.write_bytes(item["content"])
+            else:
+                with destination.open("w", encoding=encoding) as f:
+                    f.writelines(item["content"])
+
+        app.metric("bytes_written", destination.stat().st_size)
         yield item
+
+
+def _unlink(path):
+    # A destination may be a hard link to a file produced in 'link' mode (e.g.
+    # a theme static), in which case writing into it would overwrite the
+    # original file too. So we always replace a destination rather than write
+    # into it.
+    with contextlib.suppress(FileNotFoundError):
+        path.unlink()
+
+
+def _copyfile(source, destination, *, link):
+    if link:
+        with contextlib.suppress(FileNotFoundError):
+            if destination.samefile(source):
+                return
+
+    _unlink(destination)
+
+    if link:
+        # Hard links are the cheapest way to produce a file, yet they are not
+        # possible across file systems, in which case we fall back to copying.
+        try:
+            os.link(source, destination)
+        except OSError:
+            pass
+        else:
+            return
+
+    # Copying is done by the kernel where possible, so file content is never
+    # read into memory.
+    shutil.copyfile(source, destination)
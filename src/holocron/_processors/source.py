@@ -1,32 +1,149 @@
 """Populate stream with new items found on filesystem."""
 
+import codecs
+import contextlib
 import datetime
+import functools
+import hashlib
+import json
+import logging
+import mimetypes
 import os
 import pathlib
 import re
+import shutil
+import subprocess
+import tarfile
+import threading
+import zipfile
 
 import dateutil.tz
 
 import holocron
 
-from ._misc import parameters
+from ._misc import map_ordered, parameters, write_atomic
 
+_logger = logging.getLogger("holocron")
 
-def _createitem(app, path, source, encoding, tzinfo):
-    try:
-        content = path.read_text(encoding)
-    except UnicodeDecodeError:
-        content = path.read_bytes()
 
-    created = datetime.datetime.fromtimestamp(path.stat().st_ctime, tzinfo)
-    updated = datetime.datetime.fromtimestamp(path.stat().st_mtime, tzinfo)
+def _create_mimetypes():
+    # Types are guessed by Python's built-in tables only, since system
+    # databases (e.g. '/etc/mime.types', Windows registry) differ from machine
+    # to machine, and so would the type of item content. Built-in tables of
+    # older Python versions lack some types common for web sites, so we add
+    # them explicitly. Other unknown extensions are sniffed.
+    types = mimetypes.MimeTypes()
+    types.add_type("text/markdown", ".md")
+    types.add_type("text/markdown", ".markdown")
+    types.add_type("text/x-rst", ".rst")
+    types.add_type("font/otf", ".otf")
+    types.add_type("font/ttf", ".ttf")
+    types.add_type("font/woff", ".woff")
+    types.add_type("font/woff2", ".woff2")
+    return types
 
+
+_mimetypes = _create_mimetypes()
+
+# Some application types are textual, but since they are not under 'text/*'
+# umbrella, they need to be listed explicitly. Likewise, binary application
+# types are listed explicitly because there are application types that are
+# neither.
+_TEXT_APPLICATION_TYPES = frozenset(
+    {"application/ecmascript", "application/javascript", "application/json", "application/xml"}
+)
+_BINARY_APPLICATION_TYPES = frozenset(
+    {
+        "application/gzip",
+        "application/octet-stream",
+        "application/pdf",
+        "application/vnd.ms-fontobject",
+        "application/wasm",
+        "application/x-7z-compressed",
+        "application/x-bzip2",
+        "application/x-tar",
+        "application/x-xz",
+        "application/zip",
+    }
+)
+_BINARY_MAJOR_TYPES = frozenset({"audio", "font", "image", "video"})
+
+
+@functools.cache
+def _isbinary(extension):
+    """Return True if files with a given extension are binary, or None if unknown."""
+
+    mimetype, encoding = _mimetypes.guess_type("file" + extension, strict=False)
+
+    if encoding is not None:
+        return True
+
+    if mimetype is None:
+        return None
+
+    major, minor = mimetype.split("/", 1)
+
+    if major == "text" or minor.endswith(("+xml", "+json")) or mimetype in _TEXT_APPLICATION_TYPES:
+        return False
+
+    if major in _BINARY_MAJOR_TYPES or mimetype in _BINARY_APPLICATION_TYPES:
+        return True
+    return None
+
+
+class _ContentDecoder:
+    """Decode file content unless it's binary.
+
+    Whether content is binary or not is decided by a file extension first,
+    and only if the extension is unknown, the content is sniffed for NUL
+    bytes. Either way, a file is read once, and text is decoded in place.
+    """
+
+    def __init__(self, encoding, binary=None):
+        self._encoding = encoding
+        self._re_binary = re.compile(binary) if binary else None
+
+        # Sniffing for NUL bytes makes sense only for encodings where NUL
+        # byte never appears in text, which is not the case for UTF-16 and
+        # UTF-32 (and friends).
+        self.ascii_compatible = "text".encode(encoding) == b"text"
+
+    def __call__(self, source, data, *, final=True):
+        if self._re_binary and self._re_binary.match(source):
+            return data
+
+        isbinary = _isbinary(os.path.splitext(source)[1].lower())
+
+        if isbinary is None and self.ascii_compatible:
+            isbinary = b"\0" in data[:8192]
+
+        if isbinary:
+            return data
+
+        # Content may be read partially, in which case it may end in the
+        # middle of a multibyte character that must not fail decoding.
+        try:
+            if final:
+                content = data.decode(self._encoding)
+            else:
+                content = codecs.getincrementaldecoder(self._encoding)().decode(data)
+        except UnicodeDecodeError:
+            return data
+
+        # Files used to be read in text mode, which translates any kind of
+        # line endings to '\n'. We want to preserve this behaviour.
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+
+
+def _makeitem(app, source, content, created, updated):
     return holocron.WebSiteItem(
         # Memorizing 'source' property is not required for application core,
         # however, it may be useful for troubleshooting pipes as well as
         # writing 'when' conditions.
-        source=source,
-        destination=source,
+        source=pathlib.Path(source),
+        destination=pathlib.Path(source),
         content=content,
         created=created,
         updated=updated,
@@ -34,20 +151,529 @@ def _createitem(app, path, source, encoding, tzinfo):
     )
 
 
-def _finditems(app, path, pattern, encoding, tzinfo):
+# Frontmatter delimiters that are known to 'frontmatter' processor. They are
+# used to read files up to the end of frontmatter when only it is needed.
+_HEAD_DELIMITERS = {b"---": b"---", b"+++": b"+++", b"{": b"}"}
+
+
+def _readhead(f, size, scan):
+    """Read a file up to the end of its frontmatter, but no more than size bytes."""
+
+    data = f.read(min(size, 4096))
+
+    if not scan:
+        return data + f.read(size - len(data))
+
+    opening = data.split(b"\n", 1)[0].rstrip(b"\r")
+    closing = _HEAD_DELIMITERS.get(opening)
+
+    # No frontmatter means there's nothing to look for, and reading the rest
+    # of the file is a waste of I/O.
+    if closing is None:
+        return data
+
+    closings = (b"\n" + closing + b"\n", b"\n" + closing + b"\r\n")
+
+    while True:
+        for closing in closings:
+            if (end := data.find(closing, len(opening))) != -1:
+                return data[: end + len(closing)]
+
+        if len(data) >= size or not (chunk := f.read(min(len(data), size - len(data)))):
+            return data
+
+        data += chunk
+
+
+def _createitem(app, entry, source, decode, tzinfo, manifest=None, head=None, *, lazy=False):
+    # Directory entries cache stat results, so there's exactly one stat call
+    # per file no matter how many attributes we need.
+    stat = entry.stat()
+    created = datetime.datetime.fromtimestamp(stat.st_ctime, tzinfo)
+    updated = datetime.datetime.fromtimestamp(stat.st_mtime, tzinfo)
+
+    # Lazy items reference files instead of holding their content, so files
+    # that are passed through as is (e.g. images, stylesheets) are never read
+    # into memory, and 'save' may copy or link them instead.
+    if lazy:
+        return _makeitem(app, source, pathlib.Path(os.path.abspath(entry.path)), created, updated)
+
+    with open(entry.path, "rb") as f:
+        data = f.read() if head is None else _readhead(f, head, decode.ascii_compatible)
+
+    partial = len(data) < stat.st_size
+
+    item = _makeitem(app, source, decode(source, data, final=not partial), created, updated)
+
+    if partial:
+        item["partial"] = True
+
+    if manifest is not None:
+        item["unchanged"] = manifest.update(source, stat, data)
+    return item
+
+
+class _Manifest:
+    """Persistent record of files found by previous runs.
+
+    Every file is recorded along with its size, modification time, inode and
+    a hash of its content. Files with the same size, modification time and
+    inode are considered unchanged without reading them. Otherwise, their
+    content hashes are compared.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._current = {}
+
+        try:
+            with open(path, encoding="UTF-8") as f:
+                self._previous = json.load(f)["files"]
+        except FileNotFoundError:
+            self._previous = {}
+        except (ValueError, KeyError, TypeError):
+            _logger.warning("source: malformed manifest, ignoring: '%s'", path)
+            self._previous = {}
+
+    def check(self, source, stat):
+        """Return True if a file is unchanged judging by its stat."""
+
+        key = source.replace(os.sep, "/")
+        record = self._previous.get(key)
+
+        if record and record[:3] == [stat.st_size, stat.st_mtime_ns, stat.st_ino]:
+            with self._lock:
+                self._current[key] = record
+            return True
+        return False
+
+    def update(self, source, stat, data):
+        """Record a file and return True if its content is unchanged."""
+
+        if self.check(source, stat):
+            return True
+
+        key = source.replace(os.sep, "/")
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        record = self._previous.get(key)
+
+        with self._lock:
+            self._current[key] = [stat.st_size, stat.st_mtime_ns, stat.st_ino, digest]
+        return record is not None and record[3] == digest
+
+    def deleted(self):
+        return sorted(self._previous.keys() - self._current.keys())
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
+        write_atomic(self._path, json.dumps({"files": self._current}))
+
+
+def _translate_glob(glob):
+    """Translate a gitignore-like glob into a regular expression."""
+
+    parts = []
+    i, n = 0, len(glob)
+
+    while i < n:
+        if glob.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif glob.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif glob[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif glob[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif glob[i] == "[" and (j := glob.find("]", i + 2)) != -1:
+            charset = glob[i + 1 : j]
+            if charset.startswith("!"):
+                charset = "^" + charset[1:]
+            parts.append("[" + charset.replace("\\", "\\\\") + "]")
+            i = j + 1
+        else:
+            parts.append(re.escape(glob[i]))
+            i += 1
+
+    return "".join(parts)
+
+
+class _IgnoreRules:
+    """Match relative paths against gitignore-like rules.
+
+    Rules are checked while walking a directory tree, and once a directory
+    is matched, it's not walked at all. Hence files inside an ignored
+    directory can't be re-included by a negated rule, which is exactly how
+    gitignore behaves.
+    """
+
+    def __init__(self, rules):
+        self._rules = []
+        self._literals = set()
+        self._combined = None
+
+        for rule in rules:
+            rule = rule.strip()
+
+            if not rule or rule.startswith("#"):
+                continue
+
+            negate = rule.startswith("!")
+            rule = rule.removeprefix("!")
+            dironly = rule.endswith("/")
+            rule = rule.rstrip("/")
+
+            # A rule that contains a slash is anchored to a walked directory,
+            # otherwise it's matched against names at any level.
+            anchored = "/" in rule
+            rule = rule.lstrip("/")
+
+            if rule:
+                self._rules.append((rule, anchored, negate, dironly))
+
+        # The last matched rule wins, and thus rules must be checked in order
+        # if there are negated ones. Otherwise, it's enough to know whether
+        # any rule matches, so literal anchored rules (e.g. '/_site' or
+        # 'docs/build') go to a set, and others are combined in one regular
+        # expression per entry type.
+        ordered = any(negate for _, _, negate, _ in self._rules)
+        compiled = []
+
+        for rule, anchored, negate, dironly in self._rules:
+            if not ordered and anchored and not dironly and not re.search(r"[*?\[]", rule):
+                self._literals.add(rule)
+                continue
+
+            regex = _translate_glob(rule)
+            if not anchored:
+                regex = "(?:.*/)?" + regex
+            compiled.append((re.compile(regex + r"\Z"), negate, dironly))
+
+        self._rules = compiled
+
+        if not ordered:
+            self._combined = {
+                is_dir: re.compile(
+                    "|".join(
+                        f"(?:{regex.pattern})"
+                        for regex, _, dironly in compiled
+                        if is_dir or not dironly
+                    )
+                    or r"(?!)"
+                )
+                for is_dir in (False, True)
+            }
+
+    def __bool__(self):
+        return bool(self._rules or self._literals)
+
+    def match(self, path, is_dir):
+        # Subtrees matched by literal rules are skipped at the cost of a set
+        # lookup, no matter how many such rules there are.
+        if path in self._literals:
+            return True
+
+        if self._combined is not None:
+            return self._combined[is_dir].match(path) is not None
+
+        ignored = False
+        for regex, negate, dironly in self._rules:
+            if dironly and not is_dir:
+                continue
+            if regex.match(path):
+                ignored = not negate
+        return ignored
+
+
+def _walk(path, ignore):
+    # This is a lightweight version of 'os.walk()' that yields directory
+    # entries of files along with their paths relative to a given path. The
+    # relative paths are plain strings, since creating path objects for every
+    # file is costly on large trees. Like 'os.walk()', it produces files of a
+    # directory before descending into its subdirectories, doesn't follow
+    # symlinks to directories, and ignores directories it cannot read.
+    stack = [(path, "")]
+
+    while stack:
+        top, prefix = stack.pop()
+        subdirs = []
+
+        try:
+            with os.scandir(top) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    relpath = prefix + entry.name
+
+                    # Ignore rules are gitignore-like, and hence always use
+                    # forward slashes no matter what platform we run on.
+                    if ignore and ignore.match(relpath.replace(os.sep, "/"), is_dir):
+                        continue
+
+                    if not is_dir:
+                        yield entry, relpath
+                    elif not entry.is_symlink():
+                        subdirs.append((entry.path, relpath + os.sep))
+        except OSError:
+            continue
+
+        stack.extend(reversed(subdirs))
+
+
+def _findfiles(path, pattern, exclude):
     if pattern:
         re_name = re.compile(pattern)
 
-    for root, _, filenames in os.walk(path, topdown=True):
-        root = pathlib.Path(root)
+    # Similar to '.gitignore', a '.holocronignore' file in a walked directory
+    # contains rules for files and directories that must not be walked. The
+    # file itself is not content, so it's excluded unless a rule negates it.
+    rules = ["/.holocronignore", *(exclude or [])]
+    with contextlib.suppress(FileNotFoundError, NotADirectoryError):
+        with open(os.path.join(path, ".holocronignore"), encoding="UTF-8") as f:
+            rules.extend(f.read().splitlines())
+
+    ignore = _IgnoreRules(rules)
+
+    for entry, source in _walk(path, ignore):
+        if pattern and not re_name.match(source):
+            continue
+
+        yield entry, source
+
+
+def _iterarchive(path, tzinfo):
+    # Members are read sequentially in archive order, which means one
+    # contiguous read of an archive. Compressed tarballs are read in streaming
+    # mode, so they are decompressed exactly once.
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+
+                # Zip archives store modification time in local time without
+                # timezone, so we assume it's the timezone of the site.
+                updated = datetime.datetime(*info.date_time, tzinfo=tzinfo)
+                yield info.filename, archive.read(info), updated
+    else:
+        with tarfile.open(path, "r|*") as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+
+                updated = datetime.datetime.fromtimestamp(member.mtime, tzinfo)
+                yield member.name, archive.extractfile(member).read(), updated
+
+
+_absolute_re = re.compile(r"[/\\]|[A-Za-z]:")
+
+
+def _findarchiveitems(app, path, pattern, exclude, decode, tzinfo):
+    if pattern:
+        re_name = re.compile(pattern)
+
+    ignore = _IgnoreRules(exclude or [])
+
+    for name, data, updated in _iterarchive(path, tzinfo):
+        parts = [part for part in name.split("/") if part not in ("", ".")]
+
+        # Archives may contain members with absolute paths or paths that
+        # point outside of the archive. They are not something we want to
+        # produce items for.
+        if not parts or ".." in parts or _absolute_re.match(name):
+            _logger.warning("source: skipping unsafe archive member: '%s'", name)
+            continue
+
+        if ignore and (
+            any(ignore.match("/".join(parts[:i]), is_dir=True) for i in range(1, len(parts)))
+            or ignore.match("/".join(parts), is_dir=False)
+        ):
+            continue
+
+        source = os.sep.join(parts)
+
+        if pattern and not re_name.match(source):
+            continue
+
+        # Archives don't preserve change time, so modification time is the
+        # best approximation we have.
+        yield _makeitem(app, source, decode(source, data), updated, updated)
+
+
+def _gittokens(stdout):
+    buffer = b""
+
+    for chunk in iter(lambda: stdout.read(65536), b""):
+        buffer += chunk
+        *tokens, buffer = buffer.split(b"\0")
+        yield from tokens
+
+    if buffer:
+        yield buffer
 
-        for filename in filenames:
-            source = root.joinpath(filename).relative_to(path)
 
-            if pattern and not re_name.match(str(source)):
+def _gittimestamps(path):
+    """Return a mapping of relative paths to their first and last commit times.
+
+    The mapping is built from a single pass over 'git log', which is streamed
+    from the newest commit to the oldest one. Renames are followed, so a
+    renamed file gets the creation time of its original path.
+    """
+
+    git = shutil.which("git")
+    if git is None:
+        msg = "git executable is not found"
+        raise RuntimeError(msg)
+
+    process = subprocess.Popen(
+        [
+            git,
+            "-C",
+            path,
+            "log",
+            "-z",
+            "-M",
+            "--relative",
+            "--no-merges",
+            "--name-status",
+            "--format=%x00%at",
+            "--",
+            ".",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+    timestamps = {}
+
+    # Since the history is read backwards, this mapping keeps track of what
+    # path at HEAD a given historical path corresponds to. If a path was
+    # deleted, it corresponds to nothing, and its older history is ignored.
+    aliases = {}
+
+    with process:
+        tokens = _gittokens(process.stdout)
+
+        # The output is a sequence of NUL-separated tokens: an empty token
+        # followed by a commit timestamp starts a commit, and then there are
+        # statuses each followed by one path, or two paths if it's a rename
+        # or a copy.
+        for token in tokens:
+            if not token:
+                timestamp = int(next(tokens))
                 continue
 
-            yield _createitem(app, root / filename, source, encoding=encoding, tzinfo=tzinfo)
+            status = token.lstrip(b"\n")[:1]
+            old = new = os.fsdecode(next(tokens))
+
+            if status in (b"R", b"C"):
+                new = os.fsdecode(next(tokens))
+
+            key = aliases.get(new, new)
+
+            if key is not None:
+                if status == b"D":
+                    aliases[new] = None
+                else:
+                    timestamps.setdefault(key, [timestamp, timestamp])[0] = timestamp
+
+            if status == b"R":
+                aliases[old] = key
+
+        stderr = process.stderr.read()
+
+    if process.returncode != 0:
+        raise RuntimeError(stderr.decode(errors="replace").strip())
+    return timestamps
+
+
+def _reportexpected(app, files):
+    # Files are reported as expected items as soon as they are found, rather
+    # than upfront, since walking a huge tree upfront delays the first item
+    # by as long as the walk takes.
+    for file in files:
+        app.metric("expected", 1)
+        yield file
+
+
+def _finditems(
+    app,
+    path,
+    *,
+    pattern,
+    exclude,
+    decode,
+    tzinfo,
+    workers,
+    manifest,
+    skip_unchanged,
+    timestamps,
+    head,
+    lazy,
+):
+    if manifest:
+        manifest = _Manifest(manifest)
+
+    createitem = functools.partial(
+        _createitem,
+        app,
+        decode=decode,
+        tzinfo=tzinfo,
+        manifest=manifest,
+        head=head,
+        lazy=lazy,
+    )
+
+    # A directory tree is walked lazily, so items are produced while the tree
+    # is still being walked, and memory usage doesn't depend on its size.
+    files = _findfiles(path, pattern, exclude)
+
+    if manifest and skip_unchanged:
+        files = (
+            (entry, source) for entry, source in files if not manifest.check(source, entry.stat())
+        )
+
+    files = _reportexpected(app, files)
+
+    # File timestamps are not reliable in a fresh checkout, since they are set
+    # to the checkout time. For content managed by Git, we can take them from
+    # history instead.
+    if timestamps == "git":
+        try:
+            timestamps = _gittimestamps(path)
+        except (OSError, RuntimeError) as exc:
+            _logger.warning("source: cannot read git history, using file timestamps: %s", exc)
+            timestamps = {}
+    else:
+        timestamps = {}
+
+    # Reading files is I/O bound, and on network-backed volumes every read may
+    # take a while. Hence we read files on a thread pool, so the latency of
+    # reads overlaps.
+    for item in map_ordered(lambda file: createitem(*file), files, workers):
+        if timestamps and (times := timestamps.get(item["source"].as_posix())):
+            item["created"], item["updated"] = (
+                datetime.datetime.fromtimestamp(time, tzinfo) for time in times
+            )
+        yield item
+
+    # Manifest is saved only when all files are processed; otherwise, we'd
+    # lose track of changes in files that haven't been processed yet.
+    if manifest:
+        deleted = manifest.deleted()
+
+        for source in deleted:
+            _logger.info("source: deleted: '%s'", source)
+        app.metric("deleted", len(deleted))
+
+        manifest.save()
 
 
 @parameters(
@@ -60,13 +686,94 @@ def _finditems(app, path, pattern, encoding, tzinfo):
         "properties": {
             "path": {"type": "string"},
             "pattern": {"type": "string"},
+            "binary": {"type": "string"},
+            "exclude": {"type": "array", "items": {"type": "string"}},
             "encoding": {"type": "string", "format": "encoding"},
             "timezone": {"type": "string", "format": "timezone"},
+            "workers": {"type": "integer", "minimum": 1},
+            "manifest": {"type": "string", "format": "path"},
+            "skip_unchanged": {"type": "boolean"},
+            "timestamps": {"type": "string", "enum": ["stat", "git"]},
+            "head": {"type": "integer", "exclusiveMinimum": 0},
+            "lazy": {"type": "boolean"},
         },
     },
 )
-def process(app, stream, *, path=".", pattern=None, encoding="UTF-8", timezone="UTC"):
+def process(
+    app,
+    stream,
+    *,
+    path=".",
+    pattern=None,
+    binary=None,
+    exclude=None,
+    encoding="UTF-8",
+    timezone="UTC",
+    workers=1,
+    manifest=None,
+    skip_unchanged=False,
+    timestamps="stat",
+    head=None,
+    lazy=False,
+):
+    if skip_unchanged and not manifest:
+        msg = "'skip_unchanged' cannot be set without 'manifest'"
+        raise ValueError(msg)
+
+    # Manifest tracks changes by content hashes, and thus requires content to
+    # be read entirely.
+    if head is not None and manifest:
+        msg = "'head' cannot be set along with 'manifest'"
+        raise ValueError(msg)
+
+    # Lazy items are not read at all, and hence can't be partially read or
+    # tracked by content hashes.
+    if lazy and (head is not None or manifest):
+        msg = "'lazy' cannot be set along with 'head' or 'manifest'"
+        raise ValueError(msg)
+
     tzinfo = dateutil.tz.gettz(timezone)
+    decode = _ContentDecoder(encoding, binary)
+
+    # Content may be shipped as a single archive, in which case items are
+    # produced straight from archive members without extracting them.
+    if os.path.isfile(path):
+        if manifest:
+            msg = "'manifest' cannot be set when 'path' is an archive"
+            raise ValueError(msg)
+
+        if head is not None:
+            msg = "'head' cannot be set when 'path' is an archive"
+            raise ValueError(msg)
+
+        if timestamps != "stat":
+            msg = f"'timestamps' cannot be '{timestamps}' when 'path' is an archive"
+            raise ValueError(msg)
+
+        if lazy:
+            msg = "'lazy' cannot be set when 'path' is an archive"
+            raise ValueError(msg)
+
+        if not zipfile.is_zipfile(path) and not tarfile.is_tarfile(path):
+            msg = f"'path' is not a tar or zip archive: '{path}'"
+            raise ValueError(msg)
+
+        yield from stream
+        yield from _findarchiveitems(app, path, pattern, exclude, decode, tzinfo)
+        return
 
     yield from stream
-    yield from _finditems(app, path, pattern, encoding, tzinfo)
+    yield from _finditems(
+        app,
+        path,
+        pattern=pattern,
+        exclude=exclude,
+        decode=decode,
+        tzinfo=tzinfo,
+        workers=workers,
+        manifest=manifest,
+        skip_unchanged=skip_unchanged,
+        timestamps=timestamps,
+        head=head,
+        lazy=lazy,
+    )
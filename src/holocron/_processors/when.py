@@ -29,10 +29,14 @@ class _ConditionEvaluator:
         # dependency on Jinja2.
         self._env = jinja2.Environment()
         self._env.filters.update({"match": _re_match})
+        self._templates = {}
 
     def eval(self, cond, **context):
-        template = self._env.from_string(f"{{% if {cond} %}}true{{% endif %}}")
-        return template.render(**context) == "true"
+        # Conditions are evaluated for every item, so we compile each of them
+        # once rather than once per item.
+        if cond not in self._templates:
+            self._templates[cond] = self._env.from_string(f"{{% if {cond} %}}true{{% endif %}}")
+        return self._templates[cond].render(**context) == "true"
 
 
 @parameters(
@@ -54,7 +58,7 @@ class _ConditionEvaluator:
 )
 def process(app, stream, processor, *_condition, condition=None):
     untouched = collections.deque()
-    evaluator = _ConditionEvaluator()
+    evaluator = app.resource("when", _ConditionEvaluator)
 
     # Since Holocron's processor wrappers support both positional and keyword
     # arguments interface, we want to receive conditions either via positional
@@ -1,5 +1,9 @@
 """Core application test suite."""
 
+import concurrent.futures
+import threading
+import time
+
 import pytest
 
 import holocron
@@ -156,6 +160,105 @@ def test_add_processor_wrapper_illegal_name(caplog, wrapper_name):
     assert len(caplog.records) == 0
 
 
+def test_resource():
+    """.resource() creates a resource once and reuses it."""
+
+    testapp = holocron.Application()
+    factory_calls = []
+
+    def factory():
+        factory_calls.append(1)
+        return object()
+
+    resource = testapp.resource(("resource", 1), factory)
+
+    assert testapp.resource(("resource", 1), factory) is resource
+    assert testapp.resource(("resource", 2), factory) is not resource
+    assert len(factory_calls) == 2
+
+
+def test_resource_concurrent():
+    """.resource() creates a resource once when requested concurrently."""
+
+    testapp = holocron.Application()
+    factory_calls = []
+    barrier = threading.Barrier(4)
+
+    def factory():
+        factory_calls.append(1)
+        time.sleep(0.01)
+        return object()
+
+    def get():
+        barrier.wait()
+        return testapp.resource("resource", factory)
+
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        resources = [executor.submit(get) for _ in range(4)]
+        resources = {id(future.result()) for future in resources}
+
+    assert len(resources) == 1
+    assert len(factory_calls) == 1
+
+
+def test_resource_nested():
+    """.resource() allows factories to request other resources."""
+
+    testapp = holocron.Application()
+
+    def factory():
+        return [testapp.resource("inner", lambda: "yoda")]
+
+    assert testapp.resource("outer", factory) == ["yoda"]
+
+
+def test_resource_per_invoke():
+    """.resource() shares per invoke resources within a pipe invocation."""
+
+    testapp = holocron.Application()
+    resources = []
+
+    def processor(app, items):
+        resources.append(app.resource("resource", object, per_invoke=True))
+        yield from items
+
+    def subpipe(app, items):
+        yield from app.invoke([{"name": "processor"}], items)
+
+    testapp.add_processor("processor", processor)
+    testapp.add_processor("subpipe", subpipe)
+    testapp.add_pipe("pipe", [{"name": "processor"}, {"name": "subpipe"}])
+
+    for _ in range(2):
+        list(testapp.invoke("pipe"))
+
+    # Resources are shared by sub pipes, yet not between invocations.
+    assert resources[0] is resources[1]
+    assert resources[2] is resources[3]
+    assert resources[0] is not resources[2]
+
+
+@pytest.mark.parametrize(
+    ("key", "invalidated"),
+    [
+        pytest.param("a", {"a"}, id="key"),
+        pytest.param("c", set(), id="unknown"),
+        pytest.param(None, {"a", "b"}, id="all"),
+    ],
+)
+def test_invalidate_resource(key, invalidated):
+    """.invalidate_resource() drops resources so they are created again."""
+
+    testapp = holocron.Application()
+
+    resources = {key_: testapp.resource(key_, object) for key_ in ("a", "b")}
+    testapp.invalidate_resource(key)
+
+    assert {
+        key_ for key_ in ("a", "b") if testapp.resource(key_, object) is not resources[key_]
+    } == invalidated
+
+
 def test_add_pipe(caplog):
     """.add_pipe() registers a pipe."""
 
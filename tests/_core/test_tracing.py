@@ -0,0 +1,171 @@
+"""Tracer test suite."""
+
+import io
+import json
+import re
+
+import pytest
+
+import holocron
+from holocron._core.tracing import Progress, Tracer
+
+
+@pytest.fixture
+def tracer():
+    return Tracer()
+
+
+@pytest.fixture
+def testapp(tracer):
+    def spam(app, items):
+        for item in items:
+            item["spam"] = 42
+            yield item
+
+    def eggs(app, items, *, pipe):
+        yield from app.invoke(pipe, items)
+
+    instance = holocron.Application()
+    instance.add_processor("spam", spam)
+    instance.add_processor("eggs", eggs)
+    instance.add_tracer(tracer)
+    return instance
+
+
+def _contains(outer, inner):
+    return outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_trace(testapp, tracer):
+    """Tracer records a span per processor per item."""
+
+    stream = testapp.invoke(
+        [{"name": "spam"}],
+        [holocron.Item({"source": "a.md"}), holocron.Item({"source": "b.md"})],
+    )
+
+    assert list(stream) == [
+        holocron.Item({"source": "a.md", "spam": 42}),
+        holocron.Item({"source": "b.md", "spam": 42}),
+    ]
+
+    events = tracer.events
+    assert [(event["name"], event["ph"], event["args"]) for event in events] == [
+        ("spam", "X", {"source": "a.md"}),
+        ("spam", "X", {"source": "b.md"}),
+        ("spam", "X", {}),
+    ]
+
+
+def test_trace_nested(testapp, tracer):
+    """Spans of nested pipes are enclosed by the parent processor's span."""
+
+    stream = testapp.invoke(
+        [{"name": "eggs", "args": {"pipe": [{"name": "spam"}]}}],
+        [holocron.Item({"source": "a.md"})],
+    )
+
+    assert list(stream) == [holocron.Item({"source": "a.md", "spam": 42})]
+
+    spam, eggs = tracer.events[:2]
+    assert (spam["name"], eggs["name"]) == ("spam", "eggs")
+    assert _contains(eggs, spam)
+
+
+def test_trace_error(testapp, tracer):
+    """Tracer records a span for a failed processor."""
+
+    def fail(app, items):
+        yield from items
+        msg = "Boom!"
+        raise RuntimeError(msg)
+
+    testapp.add_processor("fail", fail)
+
+    with pytest.raises(RuntimeError, match="Boom!"):
+        list(testapp.invoke([{"name": "fail"}]))
+
+    assert tracer.events[-1]["args"] == {"error": "RuntimeError('Boom!')"}
+
+
+def test_dump(testapp, tracer):
+    """Tracer dumps events in Chrome Trace Event Format."""
+
+    list(testapp.invoke([{"name": "spam"}], [holocron.Item({"source": "a.md"})]))
+
+    fp = io.StringIO()
+    tracer.dump(fp)
+
+    trace = json.loads(fp.getvalue())
+    assert trace["traceEvents"] == tracer.events
+    assert {"name", "ph", "ts", "dur", "pid", "tid"} <= trace["traceEvents"][0].keys()
+
+
+def test_metric(testapp, tracer):
+    """Tracer records accumulated metrics as counter events."""
+
+    testapp.metric("bytes", 13)
+    testapp.metric("bytes", 42)
+
+    assert [(event["name"], event["ph"], event["args"]) for event in tracer.events] == [
+        ("bytes", "C", {"bytes": 13}),
+        ("bytes", "C", {"bytes": 55}),
+    ]
+
+
+def test_progress(testapp):
+    """Progress is rendered on every refresh."""
+
+    fp = io.StringIO()
+    progress = Progress(fp, interval=0)
+    testapp.add_tracer(progress)
+    testapp.metric("expected", 2)
+
+    for _ in testapp.invoke([{"name": "spam"}], [holocron.Item({"source": "a.md"})]):
+        progress.advance()
+
+    lines = fp.getvalue().splitlines()
+    assert re.fullmatch(r"0/2 items \| \d+\.\d items/s \| spam: 1", lines[0])
+    assert re.fullmatch(r"1/2 items \| \d+\.\d items/s \| ETA \d+s \| spam: 1", lines[1])
+
+
+def test_progress_clear(testapp):
+    """Progress line is erased on a terminal, so it's redrawn after other output."""
+
+    class TTY(io.StringIO):
+        def isatty(self):
+            return True
+
+    fp = TTY()
+    progress = Progress(fp, interval=0)
+    testapp.add_tracer(progress)
+
+    for _ in testapp.invoke([{"name": "spam"}], [holocron.Item({"source": "a.md"})]):
+        progress.clear()
+        fp.write("[WARN] the Force\n")
+        progress.advance()
+
+    assert re.fullmatch(
+        r"\r0 items \| \d+\.\d items/s \| spam: 1\x1b\[K"
+        r"\r\x1b\[K\[WARN\] the Force\n"
+        r"\r1 items \| \d+\.\d items/s \| spam: 1\x1b\[K",
+        fp.getvalue(),
+    )
+
+
+def test_progress_not_live(testapp):
+    """Only summary is rendered if progress is not live."""
+
+    fp = io.StringIO()
+    progress = Progress(fp, live=False, interval=0)
+    testapp.add_tracer(progress)
+
+    for _ in testapp.invoke([{"name": "spam"}], [holocron.Item({"source": "a.md"})]):
+        progress.advance()
+    testapp.metric("bytes_written", 42)
+    progress.finish()
+
+    assert re.fullmatch(
+        r"Built 1 items in \d+\.\ds \(\d+\.\d items/s\), 42 bytes written\n",
+        fp.getvalue(),
+    )
@@ -130,6 +130,108 @@ def test_args_save_as(testapp, save_as):
     ]
 
 
+def _page(testapp, page, items, previous=None, next_=None, save_as="index.html"):
+    destination = pathlib.Path(save_as)
+    if page > 1:
+        destination = destination.parent.joinpath("page", str(page), destination.name)
+
+    return holocron.WebSiteItem(
+        {
+            "source": pathlib.Path("archive://", destination),
+            "destination": destination,
+            "template": "archive.j2",
+            "items": [holocron.Item({"title": f"The Force (part #{i})"}) for i in items],
+            "page": page,
+            "previous": previous,
+            "next": next_,
+            "baseurl": testapp.metadata["url"],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    ("amount", "expected"),
+    [
+        pytest.param(0, [("page", 1, [], None, None)], id="0"),
+        pytest.param(1, [0, ("page", 1, [0], None, None)], id="1"),
+        pytest.param(2, [0, 1, ("page", 1, [0, 1], None, None)], id="2"),
+        pytest.param(
+            3,
+            [
+                0,
+                1,
+                ("page", 1, [0, 1], None, "/page/2/"),
+                2,
+                ("page", 2, [2], "/", None),
+            ],
+            id="3",
+        ),
+        pytest.param(
+            5,
+            [
+                0,
+                1,
+                ("page", 1, [0, 1], None, "/page/2/"),
+                2,
+                3,
+                ("page", 2, [2, 3], "/", "/page/3/"),
+                4,
+                ("page", 3, [4], "/page/2/", None),
+            ],
+            id="5",
+        ),
+    ],
+)
+def test_args_per_page(testapp, amount, expected):
+    """Archive processor has to produce pages as soon as they are known."""
+
+    stream = archive.process(
+        testapp,
+        [holocron.Item({"title": f"The Force (part #{i})"}) for i in range(amount)],
+        per_page=2,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        _page(testapp, *entry[1:])
+        if isinstance(entry, tuple)
+        else holocron.Item({"title": f"The Force (part #{entry})"})
+        for entry in expected
+    ]
+
+
+def test_args_per_page_save_as(testapp):
+    """Archive processor has to put pages next to 'save_as'."""
+
+    stream = archive.process(
+        testapp,
+        [holocron.Item({"title": f"The Force (part #{i})"}) for i in range(2)],
+        per_page=1,
+        save_as="posts/index.html",
+    )
+
+    assert [item["destination"] for item in stream if "page" in item] == [
+        pathlib.Path("posts", "index.html"),
+        pathlib.Path("posts", "page", "2", "index.html"),
+    ]
+
+
+def test_args_per_page_lazy(testapp):
+    """Archive processor has to not consume a stream beyond a page ahead."""
+
+    def stream():
+        for i in range(10):
+            yield holocron.Item({"title": f"The Force (part #{i})"})
+
+        msg = "stream is consumed"
+        raise AssertionError(msg)
+
+    pages = (item for item in archive.process(testapp, stream(), per_page=2) if "page" in item)
+
+    assert next(pages) == _page(testapp, 1, [0, 1], None, "/page/2/")
+    assert next(pages) == _page(testapp, 2, [2, 3], "/", "/page/3/")
+
+
 @pytest.mark.parametrize(
     ("args", "error"),
     [
@@ -163,6 +265,11 @@ def test_args_save_as(testapp, save_as):
             "template: {'y': 2} is not of type 'string'",
             id="template-dict",
         ),
+        pytest.param(
+            {"per_page": 0},
+            "per_page: 0 is less than the minimum of 1",
+            id="per_page-zero",
+        ),
     ],
 )
 def test_args_bad_value(testapp, args, error):
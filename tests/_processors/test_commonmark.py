@@ -4,7 +4,9 @@ import collections.abc
 import pathlib
 import re
 import textwrap
+import unittest.mock
 
+import pygments
 import pytest
 
 import holocron
@@ -367,6 +369,41 @@ def test_args_pygmentize(testapp, rendered, pygmentize):
     ]
 
 
+def test_args_highlight_cache(testapp, tmp_path, monkeypatch):
+    """Commonmark has to highlight identical code blocks once."""
+
+    highlight = unittest.mock.Mock(wraps=pygments.highlight)
+    monkeypatch.setattr(pygments, "highlight", highlight)
+
+    code = "print('yoda')"
+
+    def build(app):
+        stream = commonmark.process(
+            app,
+            [
+                holocron.Item(
+                    {
+                        "content": f"```python\n{code}\n```\n",
+                        "destination": pathlib.Path(f"{i}.md"),
+                    }
+                )
+                for i in range(2)
+            ],
+            pygmentize=True,
+            highlight_cache=str(tmp_path.joinpath("cache")),
+        )
+        return [item["content"] for item in stream]
+
+    assert build(testapp) == build(testapp)
+    assert highlight.call_count == 1
+    assert len(list(tmp_path.joinpath("cache").iterdir())) == 1
+
+    # Another application doesn't share in-memory results, but reuses ones
+    # persisted on disk.
+    assert build(holocron.Application()) == build(testapp)
+    assert highlight.call_count == 1
+
+
 @pytest.mark.parametrize("language", [pytest.param("yoda"), pytest.param("vader")])
 def test_args_pygmentize_unknown_language(testapp, language):
     """Commonmark has to assume text/plain for unknown languages."""
@@ -441,6 +478,320 @@ def test_item_exec(testapp):
     ]
 
 
+def test_item_exec_many(testapp):
+    """Commonmark has to run exec fences concurrently and preserve order."""
+
+    stream = commonmark.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": textwrap.dedent(
+                        f"""
+                        ```text {{"exec": ["sh", "-c", "sleep 0.{3 - i}; cat"]}}
+                        {i}a
+                        ```
+
+                        ```text {{"exec": ["sh", "-c", "sleep 0.{i}; cat"]}}
+                        {i}b
+                        ```
+                        """
+                    ),
+                    "source": pathlib.Path(f"{i}.md"),
+                    "destination": pathlib.Path(f"{i}.md"),
+                }
+            )
+            for i in range(3)
+        ],
+        exec_workers=4,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        holocron.Item(
+            {
+                "content": f"{i}a\n{i}b\n",
+                "source": pathlib.Path(f"{i}.md"),
+                "destination": pathlib.Path(f"{i}.html"),
+            },
+        )
+        for i in range(3)
+    ]
+
+
+def test_item_exec_none(testapp, monkeypatch):
+    """Commonmark has to not spawn an exec pool for documents without exec fences."""
+
+    executor = unittest.mock.Mock(wraps=commonmark.concurrent.futures.ThreadPoolExecutor)
+    monkeypatch.setattr(commonmark.concurrent.futures, "ThreadPoolExecutor", executor)
+
+    stream = commonmark.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": "```text\nyoda\n```\n",
+                    "destination": pathlib.Path("1.md"),
+                }
+            )
+        ],
+    )
+
+    assert list(stream) == [
+        holocron.Item(
+            {
+                "content": '<pre><code class="language-text">yoda\n</code></pre>\n',
+                "destination": pathlib.Path("1.html"),
+            }
+        ),
+    ]
+    assert executor.call_count == 0
+
+
+def test_item_exec_timeout(testapp):
+    """Commonmark has to respect a per-fence timeout of exec fences."""
+
+    stream = commonmark.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": textwrap.dedent(
+                        """
+                        ```text {"exec": ["sleep", "5"], "timeout": 0.1}
+                        yoda, a jedi grandmaster
+                        ```
+                        """
+                    ),
+                    "destination": pathlib.Path("1.md"),
+                }
+            )
+        ],
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        holocron.Item(
+            {
+                "content": "timed out executing the command",
+                "destination": pathlib.Path("1.html"),
+            },
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("exec_timeout", "content"),
+    [
+        pytest.param(1000, "", id="success"),
+        pytest.param(0.1, "timed out executing the command", id="timeout"),
+    ],
+)
+def test_args_exec_timeout(testapp, exec_timeout, content):
+    """Commonmark has to respect a default timeout of exec fences."""
+
+    stream = commonmark.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": textwrap.dedent(
+                        """
+                        ```text {"exec": ["sleep", "0.5"]}
+                        ```
+                        """
+                    ),
+                    "destination": pathlib.Path("1.md"),
+                }
+            )
+        ],
+        exec_timeout=exec_timeout,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        holocron.Item({"content": content, "destination": pathlib.Path("1.html")}),
+    ]
+
+
+def test_args_exec_cache(testapp, tmp_path):
+    """Commonmark has to cache output of exec fences if asked to."""
+
+    counter = tmp_path.joinpath("counter")
+    cache = tmp_path.joinpath("cache")
+
+    def build(text):
+        stream = commonmark.process(
+            testapp,
+            [
+                holocron.Item(
+                    {
+                        "content": textwrap.dedent(
+                            f"""
+                            ```text {{"exec": ["sh", "-c", "echo >> {counter}; cat"]}}
+                            {text}
+                            ```
+                            """
+                        ),
+                        "destination": pathlib.Path("1.md"),
+                    }
+                )
+            ],
+            exec_cache=str(cache),
+        )
+        return [item["content"] for item in stream]
+
+    assert build("yoda") == ["yoda\n"]
+    assert build("yoda") == ["yoda\n"]
+    assert counter.read_text() == "\n"
+
+    assert build("luke") == ["luke\n"]
+    assert counter.read_text() == "\n\n"
+    assert len(list(cache.iterdir())) == 2
+
+
+def test_args_exec_cache_failure(testapp, tmp_path):
+    """Commonmark has to not cache failed exec fences."""
+
+    cache = tmp_path.joinpath("cache")
+
+    stream = commonmark.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": textwrap.dedent(
+                        """
+                        ```text {"exec": ["sh", "-c", "echo -n boom >&2; exit 1"]}
+                        ```
+                        """
+                    ),
+                    "destination": pathlib.Path("1.md"),
+                }
+            )
+        ],
+        exec_cache=str(cache),
+    )
+
+    assert [item["content"] for item in stream] == ["boom"]
+    assert list(cache.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        pytest.param(
+            {"tokens": True},
+            {
+                "tokens": [
+                    {"type": "heading_open", "tag": "h2", "nesting": 1, "markup": "##"},
+                    {
+                        "type": "inline",
+                        "content": "Jedi `order`",
+                        "children": [
+                            {"type": "text", "content": "Jedi "},
+                            {
+                                "type": "code_inline",
+                                "tag": "code",
+                                "content": "order",
+                                "markup": "`",
+                            },
+                        ],
+                    },
+                    {"type": "heading_close", "tag": "h2", "nesting": -1, "markup": "##"},
+                    {"type": "paragraph_open", "tag": "p", "nesting": 1},
+                    {
+                        "type": "inline",
+                        "content": "may the force\nbe with you",
+                        "children": [
+                            {"type": "text", "content": "may the force"},
+                            {"type": "softbreak", "tag": "br"},
+                            {"type": "text", "content": "be with you"},
+                        ],
+                    },
+                    {"type": "paragraph_close", "tag": "p", "nesting": -1},
+                    {"type": "paragraph_open", "tag": "p", "nesting": 1},
+                    {
+                        "type": "inline",
+                        "content": "Second *para* here  \nand more",
+                        "children": [
+                            {"type": "text", "content": "Second "},
+                            {"type": "em_open", "tag": "em", "nesting": 1, "markup": "*"},
+                            {"type": "text", "content": "para"},
+                            {"type": "em_close", "tag": "em", "nesting": -1, "markup": "*"},
+                            {"type": "text", "content": " here"},
+                            {"type": "hardbreak", "tag": "br"},
+                            {"type": "text", "content": "and more"},
+                        ],
+                    },
+                    {"type": "paragraph_close", "tag": "p", "nesting": -1},
+                ]
+            },
+            id="tokens",
+        ),
+        pytest.param(
+            {"outline": True},
+            {"outline": [{"level": 2, "title": "Jedi order"}]},
+            id="outline",
+        ),
+        pytest.param(
+            {"excerpt": True},
+            {"excerpt": "<p>may the force\nbe with you</p>\n"},
+            id="excerpt",
+        ),
+        pytest.param(
+            {"wordcount": True},
+            {"wordcount": 13},
+            id="wordcount",
+        ),
+    ],
+)
+def test_args_document_structure(testapp, args, expected):
+    """Commonmark has to expose document structure if asked to."""
+
+    stream = commonmark.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": textwrap.dedent(
+                        """
+                        # Yoda
+
+                        ## Jedi `order`
+
+                        may the force
+                        be with you
+
+                        Second *para* here\x20\x20
+                        and more
+                        """
+                    ),
+                    "destination": pathlib.Path("1.md"),
+                }
+            )
+        ],
+        infer_title=True,
+        **args,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        holocron.Item(
+            {
+                "content": (
+                    "<h2>Jedi <code>order</code></h2>\n"
+                    "<p>may the force\nbe with you</p>\n"
+                    "<p>Second <em>para</em> here<br />\nand more</p>\n"
+                ),
+                "destination": pathlib.Path("1.html"),
+                "title": "Yoda",
+                **expected,
+            }
+        )
+    ]
+
+
 def test_args_strikethrough(testapp):
     """Commonmark has to support strikethrough extension."""
 
@@ -626,7 +977,37 @@ def test_args_definition(testapp):
             {"pygmentize": 42},
             "pygmentize: 42 is not of type 'boolean'",
             id="pygmentize",
-        )
+        ),
+        pytest.param(
+            {"highlight_cache": 42},
+            "highlight_cache: 42 is not of type 'string'",
+            id="highlight_cache-type",
+        ),
+        pytest.param(
+            {"outline": 42},
+            "outline: 42 is not of type 'boolean'",
+            id="outline-type",
+        ),
+        pytest.param(
+            {"exec_workers": 0},
+            "exec_workers: 0 is less than the minimum of 1",
+            id="exec_workers-min",
+        ),
+        pytest.param(
+            {"exec_workers": "4"},
+            "exec_workers: '4' is not of type 'integer'",
+            id="exec_workers-type",
+        ),
+        pytest.param(
+            {"exec_timeout": 0},
+            "exec_timeout: 0 is less than or equal to the minimum of 0",
+            id="exec_timeout-min",
+        ),
+        pytest.param(
+            {"exec_cache": 42},
+            "exec_cache: 42 is not of type 'string'",
+            id="exec_cache-type",
+        ),
     ],
 )
 def test_args_bad_value(testapp, args, error):
@@ -1,6 +1,7 @@
 """Frontmatter processor test suite."""
 
 import collections.abc
+import json
 import textwrap
 
 import pytest
@@ -217,6 +218,81 @@ def test_item_with_frontmatter_in_text(testapp):
     ]
 
 
+def test_item_with_delimiter_in_text(testapp):
+    """Frontmatter has to end at the first closing delimiter."""
+
+    stream = frontmatter.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": textwrap.dedent(
+                        """\
+                        ---
+                        author: Yoda
+                        ---
+                        I am a Jedi, like my father before me.
+
+                        ---
+
+                        May the Force be with you!
+                        ---
+                        """
+                    )
+                }
+            )
+        ],
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        holocron.Item(
+            {
+                "content": textwrap.dedent(
+                    """\
+                    I am a Jedi, like my father before me.
+
+                    ---
+
+                    May the Force be with you!
+                    ---
+                    """
+                ),
+                "author": "Yoda",
+            }
+        )
+    ]
+
+
+def test_item_partial_without_frontmatter(testapp, caplog):
+    """Frontmatter processor has to warn if a partial item has no frontmatter."""
+
+    stream = frontmatter.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": "---\nauthor: Yoda\n",
+                    "source": "cv.md",
+                    "partial": True,
+                }
+            )
+        ],
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        holocron.Item(
+            {
+                "content": "---\nauthor: Yoda\n",
+                "source": "cv.md",
+                "partial": True,
+            }
+        )
+    ]
+    assert caplog.messages == ["frontmatter: not found in partially read item: 'cv.md'"]
+
+
 def test_item_with_frontmatter_leading_whitespaces(testapp):
     """Leading whitespaces before frontmatter has to be ignored."""
 
@@ -477,6 +553,28 @@ def test_args_overwrite(testapp, overwrite):
             None,
             id="toml",
         ),
+        pytest.param(
+            """\
+            {
+              "author": "Yoda",
+              "master": true,
+              "labels": ["force", "motto"]
+            }
+            """.rstrip(),
+            "json",
+            None,
+            id="json",
+        ),
+        pytest.param(
+            """\
+            {
+              "author": Yoda
+            }
+            """.rstrip(),
+            "json",
+            json.JSONDecodeError("Expecting value", '{\n  "author": Yoda\n}', 14),
+            id="json-invalid",
+        ),
         pytest.param(
             """\
             ---
@@ -541,6 +639,11 @@ def test_args_format(testapp, frontsnippet, format, exception):
             "delimiter: 42 is not of type 'string'",
             id="delimiter",
         ),
+        pytest.param(
+            {"format": "ini"},
+            "format: 'ini' is not one of ['yaml', 'toml', 'json']",
+            id="format",
+        ),
         pytest.param(
             {"overwrite": "true"},
             "overwrite: 'true' is not of type 'boolean'",
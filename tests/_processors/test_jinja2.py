@@ -1,6 +1,7 @@
 """Jinja2 processor test suite."""
 
 import collections.abc
+import os
 import pathlib
 import textwrap
 import unittest.mock
@@ -179,7 +180,7 @@ def test_args_themes(testapp, tmpdir):
         ),
         holocron.WebSiteItem(
             {
-                "content": "article { margin: 0 }",
+                "content": pathlib.Path(tmpdir.join("theme_a", "static", "style.css").strpath),
                 "source": pathlib.Path("static", "style.css"),
                 "destination": pathlib.Path("static", "style.css"),
                 "created": unittest.mock.ANY,
@@ -274,6 +275,299 @@ def test_args_themes_two_themes(testapp, tmpdir):
     ]
 
 
+def test_args_bytecode_cache(testapp, tmpdir):
+    """Jinja2 processor has to cache compiled templates if asked to."""
+
+    tmpdir.ensure("theme_a", "templates", "item.j2").write_text(
+        "rendered: {{ item.title }}",
+        encoding="UTF-8",
+    )
+
+    def render():
+        stream = jinja2.process(
+            testapp,
+            [holocron.Item({"title": "History of the Force"})],
+            themes=[tmpdir.join("theme_a").strpath],
+            bytecode_cache=tmpdir.join("cache").strpath,
+        )
+        return [item["content"] for item in stream]
+
+    assert render() == ["rendered: History of the Force"]
+    assert len(tmpdir.join("cache").listdir()) == 1
+
+    with unittest.mock.patch("jinja2.Environment.compile") as compile_:
+        assert render() == ["rendered: History of the Force"]
+    assert not compile_.called
+
+
+def test_args_themes_precompiled(testapp, tmpdir, caplog):
+    """Jinja2 processor has to use precompiled theme templates."""
+
+    tmpdir.ensure("theme_a", "templates", "item.j2").write_text(
+        "compiled: {{ item.title }}",
+        encoding="UTF-8",
+    )
+    tmpdir.ensure("theme_a", "templates", "page.j2").write_text(
+        "page: {{ item.title }}",
+        encoding="UTF-8",
+    )
+    jinja2.compile_theme(tmpdir.join("theme_a").strpath)
+    compiled = max(path.mtime() for path in tmpdir.join("theme_a", "templates.compiled").listdir())
+
+    # Compiled templates are used unless their sources are changed afterwards,
+    # while templates that are not compiled are loaded from sources.
+    tmpdir.join("theme_a", "templates", "item.j2").write_text(
+        "source: {{ item.title }}",
+        encoding="UTF-8",
+    )
+    tmpdir.join("theme_a", "templates", "item.j2").setmtime(compiled + 10)
+    tmpdir.join("theme_a", "templates", "page.j2").write_text(
+        "source: {{ item.title }}",
+        encoding="UTF-8",
+    )
+    tmpdir.join("theme_a", "templates", "page.j2").setmtime(compiled - 10)
+    tmpdir.ensure("theme_a", "templates", "post.j2").write_text(
+        "post: {{ item.title }}",
+        encoding="UTF-8",
+    )
+
+    stream = jinja2.process(
+        testapp,
+        [
+            holocron.Item({"title": "History of the Force"}),
+            holocron.Item({"title": "History of the Force", "template": "page.j2"}),
+            holocron.Item({"title": "History of the Force", "template": "post.j2"}),
+        ],
+        themes=[tmpdir.join("theme_a").strpath],
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert [item["content"] for item in stream] == [
+        "source: History of the Force",
+        "page: History of the Force",
+        "post: History of the Force",
+    ]
+    assert caplog.messages == [
+        "jinja2: compiled template is outdated, using source: 'item.j2'",
+    ]
+
+
+def test_args_themes_shared(testapp, tmpdir):
+    """Jinja2 processor has to share environment between invocations."""
+
+    tmpdir.ensure("theme_a", "templates", "item.j2").write_text(
+        "rendered: {{ item.title }}",
+        encoding="UTF-8",
+    )
+
+    def render():
+        stream = jinja2.process(
+            testapp,
+            [holocron.Item({"title": "History of the Force"})],
+            themes=[tmpdir.join("theme_a").strpath],
+        )
+        return [item["content"] for item in stream]
+
+    assert render() == ["rendered: History of the Force"]
+
+    with unittest.mock.patch("jinja2.Environment.compile") as compile_:
+        assert render() == ["rendered: History of the Force"]
+    assert not compile_.called
+
+    # Templates are still reloaded once changed.
+    tmpdir.join("theme_a", "templates", "item.j2").write_text(
+        "changed: {{ item.title }}",
+        encoding="UTF-8",
+    )
+    os.utime(tmpdir.join("theme_a", "templates", "item.j2"), (0, 0))
+    assert render() == ["changed: History of the Force"]
+
+
+@pytest.mark.parametrize(
+    ("fragment", "rendered"),
+    [
+        pytest.param(
+            '{% cache "sidebar" %}{{ item.title }}{% endcache %}',
+            ["yoda", "yoda", "yoda"],
+            id="key",
+        ),
+        pytest.param(
+            "{% cache item.title %}{{ item.title }}{% endcache %}",
+            ["yoda", "vader", "yoda"],
+            id="key-value",
+        ),
+        pytest.param(
+            "{% cache item %}{{ item.title }}{% endcache %}",
+            ["yoda", "vader", "yoda"],
+            id="key-item",
+        ),
+        pytest.param(
+            '{% cache "a" %}{{ item.title }}{% endcache %}'
+            '{% cache "a" %}{{ item.title }}!{% endcache %}',
+            ["yodayoda!", "yodayoda!", "yodayoda!"],
+            id="key-per-fragment",
+        ),
+    ],
+)
+def test_item_fragment_cache(testapp, tmpdir, fragment, rendered):
+    """Jinja2 processor has to render cached fragments once per key."""
+
+    tmpdir.ensure("theme_a", "templates", "item.j2").write_text(fragment, encoding="UTF-8")
+
+    stream = jinja2.process(
+        testapp,
+        [
+            holocron.Item({"title": "yoda"}),
+            holocron.Item({"title": "vader"}),
+            holocron.Item({"title": "yoda"}),
+        ],
+        themes=[tmpdir.join("theme_a").strpath],
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert [item["content"] for item in stream] == rendered
+
+
+@pytest.mark.parametrize(
+    ("ttl", "age", "rendered"),
+    [
+        pytest.param("", 7200, "yoda", id="no-ttl"),
+        pytest.param(", 3600", 60, "yoda", id="ttl-fresh"),
+        pytest.param(", 3600", 7200, "vader", id="ttl-expired"),
+    ],
+)
+def test_args_fragment_cache(tmpdir, ttl, age, rendered):
+    """Jinja2 processor has to persist cached fragments if asked to."""
+
+    tmpdir.ensure("theme_a", "templates", "item.j2").write_text(
+        f'{{% cache "sidebar"{ttl} %}}{{{{ item.title }}}}{{% endcache %}}',
+        encoding="UTF-8",
+    )
+
+    def render(title):
+        # Every build is a new application, so fragments can be reused only
+        # if they are persisted.
+        stream = jinja2.process(
+            holocron.Application({"url": "https://yoda.ua"}),
+            [holocron.Item({"title": title})],
+            themes=[tmpdir.join("theme_a").strpath],
+            fragment_cache=tmpdir.join("cache").strpath,
+        )
+        return [item["content"] for item in stream]
+
+    assert render("yoda") == ["yoda"]
+
+    for fragment in tmpdir.join("cache").listdir():
+        os.utime(fragment, (fragment.mtime() - age, fragment.mtime() - age))
+
+    assert render("vader") == [rendered]
+
+
+def test_args_streaming(testapp, tmpdir):
+    """Jinja2 processor has to defer rendering in streaming mode."""
+
+    tmpdir.ensure("theme_a", "templates", "item.j2").write_text(
+        "{% for item in item['items'] %}{{ item }}\n{% endfor %}",
+        encoding="UTF-8",
+    )
+
+    stream = jinja2.process(
+        testapp,
+        [holocron.Item({"items": ["yoda", "vader"]})],
+        themes=[tmpdir.join("theme_a").strpath],
+        streaming=True,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+
+    items = list(stream)
+    assert len(items) == 1
+    assert isinstance(items[0]["content"], collections.abc.Iterator)
+    assert "".join(items[0]["content"]) == "yoda\nvader\n"
+
+
+def test_args_streaming_item_content(testapp):
+    """Jinja2 processor has to render item content in streaming mode."""
+
+    def render(streaming):
+        stream = jinja2.process(
+            testapp,
+            [holocron.Item({"title": "History of the Force", "content": "the Force"})],
+            streaming=streaming,
+        )
+        return "".join(next(stream)["content"])
+
+    content = render(streaming=True)
+
+    soup = bs4.BeautifulSoup(content, "html.parser")
+    assert list(soup.article.stripped_strings)[1] == "the Force"
+    assert content == render(streaming=False)
+
+
+def test_args_streaming_fragment_cache(tmpdir):
+    """Jinja2 processor has to fingerprint items the same way in streaming mode."""
+
+    tmpdir.ensure("theme_a", "templates", "item.j2").write_text(
+        "{% cache item %}{{ item.content }}{% endcache %}",
+        encoding="UTF-8",
+    )
+
+    def render():
+        stream = jinja2.process(
+            holocron.Application({"url": "https://yoda.ua"}),
+            [holocron.Item({"content": "the Force"})],
+            themes=[tmpdir.join("theme_a").strpath],
+            fragment_cache=tmpdir.join("cache").strpath,
+            streaming=True,
+        )
+        return ["".join(item["content"]) for item in stream]
+
+    assert render() == render() == ["the Force"]
+    assert len(tmpdir.join("cache").listdir()) == 1
+
+
+def test_args_themes_statics_once(testapp, tmpdir):
+    """Jinja2 processor has to produce theme statics once per pipe invocation."""
+
+    for theme in ("theme_a", "theme_b"):
+        tmpdir.ensure(theme, "templates", "item.j2").write_text(theme, encoding="UTF-8")
+        tmpdir.ensure(theme, "static", "style.css").write_text(theme, encoding="UTF-8")
+    tmpdir.ensure("theme_b", "static", "logo.svg").write_text("<svg/>", encoding="UTF-8")
+    testapp.metric = unittest.mock.Mock()
+
+    def render(app, stream):
+        # A pipe may render items several times (e.g. posts and archive),
+        # while statics must be produced once.
+        for title in ("History of the Force", "History of the Jedi"):
+            yield from jinja2.process(
+                app,
+                [holocron.Item({"title": title})],
+                themes=[tmpdir.join("theme_a").strpath, tmpdir.join("theme_b").strpath],
+            )
+
+    testapp.add_processor("render", render)
+    testapp.add_pipe("pipe", [{"name": "render"}])
+
+    # Every invocation is a new build (e.g. into a clean directory), so
+    # statics are produced by every invocation.
+    for _ in range(2):
+        assert [(item.get("source"), item["content"]) for item in testapp.invoke("pipe")] == [
+            (None, "theme_a"),
+            (
+                pathlib.Path("static", "style.css"),
+                pathlib.Path(tmpdir.join("theme_a", "static", "style.css").strpath),
+            ),
+            (
+                pathlib.Path("static", "logo.svg"),
+                pathlib.Path(tmpdir.join("theme_b", "static", "logo.svg").strpath),
+            ),
+            (None, "theme_a"),
+        ]
+
+    # Only statics that are produced are reported as expected.
+    assert testapp.metric.call_args_list == [unittest.mock.call("expected", 1)] * 4
+
+
 @pytest.mark.parametrize(
     ("args", "error"),
     [
@@ -292,6 +586,21 @@ def test_args_themes_two_themes(testapp, tmpdir):
             "themes: {'foo': 1} is not of type 'array'",
             id="themes-dict",
         ),
+        pytest.param(
+            {"bytecode_cache": 42},
+            "bytecode_cache: 42 is not of type 'string'",
+            id="bytecode_cache-int",
+        ),
+        pytest.param(
+            {"fragment_cache": 42},
+            "fragment_cache: 42 is not of type 'string'",
+            id="fragment_cache-int",
+        ),
+        pytest.param(
+            {"streaming": 42},
+            "streaming: 42 is not of type 'boolean'",
+            id="streaming-int",
+        ),
     ],
 )
 def test_args_bad_value(testapp, args, error):
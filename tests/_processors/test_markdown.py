@@ -363,6 +363,99 @@ def test_item_with_fenced_code(testapp):
     ]
 
 
+def test_args_highlight_cache(testapp, tmp_path, monkeypatch):
+    """Markdown processor has to highlight identical code blocks once."""
+
+    highlight = unittest.mock.Mock(wraps=markdown.markdown.extensions.codehilite.highlight)
+    monkeypatch.setattr(markdown.markdown.extensions.codehilite, "highlight", highlight)
+
+    code = "print('yoda')"
+
+    def build(app):
+        stream = markdown.process(
+            app,
+            [
+                holocron.Item(
+                    {
+                        "content": f"```python\n{code}\n```\n\n    :::python\n    {code}\n",
+                        "destination": pathlib.Path(f"{i}.md"),
+                    }
+                )
+                for i in range(2)
+            ],
+            highlight_cache=str(tmp_path.joinpath("cache")),
+        )
+        return [item["content"] for item in stream]
+
+    assert build(testapp) == build(testapp)
+    assert highlight.call_count == 2
+    assert len(list(tmp_path.joinpath("cache").iterdir())) == 2
+
+    # Another application doesn't share in-memory results, but reuses ones
+    # persisted on disk.
+    assert build(holocron.Application()) == build(testapp)
+    assert highlight.call_count == 2
+
+
+def test_args_highlight_cache_isolated(testapp):
+    """Markdown processor has to highlight code without patching extensions."""
+
+    codehilite = markdown.markdown.extensions.codehilite.CodeHilite
+    fenced_codehilite = markdown.markdown.extensions.fenced_code.CodeHilite
+
+    stream = markdown.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": "```python\nprint('yoda')\n```\n",
+                    "destination": pathlib.Path("1.md"),
+                }
+            )
+        ],
+    )
+
+    assert next(stream)["content"] == markdown.markdown.markdown(
+        "```python\nprint('yoda')\n```\n",
+        extensions=["markdown.extensions.codehilite", "markdown.extensions.extra"],
+        extension_configs={"markdown.extensions.codehilite": {"css_class": "highlight"}},
+    )
+    assert markdown.markdown.extensions.codehilite.CodeHilite is codehilite
+    assert markdown.markdown.extensions.fenced_code.CodeHilite is fenced_codehilite
+
+
+def test_args_highlight_cache_unsupported(testapp, tmp_path, monkeypatch, caplog):
+    """Markdown processor has to warn if highlighting cannot be cached."""
+
+    hiliter = markdown.markdown.extensions.codehilite.HiliteTreeprocessor
+    run = hiliter.run
+
+    # Python-Markdown may change the way processors highlight code, in which
+    # case highlighting works as usual, yet without a cache.
+    monkeypatch.setattr(hiliter, "run", lambda self, root: run(self, root))
+
+    stream = markdown.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": "    :::python\n    print('yoda')\n",
+                    "destination": pathlib.Path("1.md"),
+                }
+            )
+        ],
+        highlight_cache=str(tmp_path.joinpath("cache")),
+    )
+
+    assert next(stream)["content"] == markdown.markdown.markdown(
+        "    :::python\n    print('yoda')\n",
+        extensions=["markdown.extensions.codehilite"],
+        extension_configs={"markdown.extensions.codehilite": {"css_class": "highlight"}},
+    )
+    assert caplog.messages == ["markdown: highlight cache is not supported by 'hilite'"]
+    assert not list(tmp_path.joinpath("cache").iterdir())
+
+
 def test_item_with_table(testapp):
     """Markdown processor has to support table syntax (markup extension)."""
 
@@ -521,6 +614,69 @@ def test_args_extensions(testapp, extensions, rendered):
     ]
 
 
+def test_item_many_isolated(testapp):
+    """Markdown processor has to convert items independently."""
+
+    stream = markdown.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": f"the key is {i}[^{i}]\n\n[^{i}]: yoda {i}\n",
+                    "destination": pathlib.Path(f"{i}.md"),
+                }
+            )
+            for i in range(2)
+        ],
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert [[f"yoda {i}" in item["content"] for i in range(2)] for item in stream] == [
+        [True, False],
+        [False, True],
+    ]
+
+
+@pytest.mark.parametrize(
+    "workers",
+    [
+        pytest.param(1),
+        pytest.param(2),
+        pytest.param(4),
+    ],
+)
+def test_args_workers(testapp, workers):
+    """Markdown processor has to convert items concurrently in order."""
+
+    stream = markdown.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": f"the key is **{i}**[^1]\n\n[^1]: note {i}\n",
+                    "destination": pathlib.Path(f"{i}.md"),
+                }
+            )
+            for i in range(10)
+        ],
+        workers=workers,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        holocron.Item(
+            {
+                "content": _pytest_regex(
+                    rf"<p>the key is <strong>{i}</strong>.*<p>note {i}&#160;.*",
+                    re.DOTALL,
+                ),
+                "destination": pathlib.Path(f"{i}.html"),
+            }
+        )
+        for i in range(10)
+    ]
+
+
 @pytest.mark.parametrize(
     ("args", "error"),
     [
@@ -534,6 +690,16 @@ def test_args_extensions(testapp, extensions, rendered):
             r"extensions: 'a' does not match '^markdown\\.extensions\\..*'",
             id="extensions-dict",
         ),
+        pytest.param(
+            {"highlight_cache": 42},
+            "highlight_cache: 42 is not of type 'string'",
+            id="highlight_cache-type",
+        ),
+        pytest.param(
+            {"workers": 0},
+            "workers: 0 is less than the minimum of 1",
+            id="workers-min",
+        ),
     ],
 )
 def test_args_bad_value(testapp, args, error):
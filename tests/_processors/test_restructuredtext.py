@@ -358,6 +358,130 @@ def test_item_many(testapp, amount):
     ]
 
 
+def test_item_many_isolated(testapp):
+    """reStructuredText processor has to convert items independently."""
+
+    content = textwrap.dedent(
+        """\
+        text
+
+        section
+        -------
+
+        text
+        """
+    )
+
+    stream = restructuredtext.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": "some title\n==========\n\n" + content,
+                    "destination": pathlib.Path("1.rst"),
+                }
+            ),
+            holocron.Item(
+                {
+                    "content": content,
+                    "destination": pathlib.Path("2.rst"),
+                }
+            ),
+        ],
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        holocron.Item(
+            {
+                "content": _pytest_regex(r"<p>text</p>\s*<span id=section></span>"),
+                "destination": pathlib.Path("1.html"),
+                "title": "some title",
+            }
+        ),
+        holocron.Item(
+            {
+                "content": _pytest_regex(r"<p>text</p>\s*<span id=section></span>"),
+                "destination": pathlib.Path("2.html"),
+            }
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        pytest.param(
+            {"outline": True},
+            {
+                "outline": [
+                    {"level": 2, "title": "jedi"},
+                    {"level": 3, "title": "masters"},
+                    {"level": 2, "title": "sith"},
+                ]
+            },
+            id="outline",
+        ),
+        pytest.param(
+            {"docinfo": True},
+            {"docinfo": {"date": "2024-05-04", "tags": "force, jedi"}},
+            id="docinfo",
+        ),
+        pytest.param(
+            {"excerpt": True},
+            {"excerpt": "may the force be with you"},
+            id="excerpt",
+        ),
+    ],
+)
+def test_args_document_structure(testapp, args, expected):
+    """reStructuredText processor has to expose document structure if asked to."""
+
+    stream = restructuredtext.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": textwrap.dedent(
+                        """\
+                        yoda
+                        ====
+
+                        :date: 2024-05-04
+                        :tags: force, jedi
+
+                        may the *force* be with you
+
+                        jedi
+                        ----
+
+                        masters
+                        ```````
+
+                        sith
+                        ----
+                        """
+                    ),
+                    "destination": pathlib.Path("1.rst"),
+                }
+            )
+        ],
+        **args,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        holocron.Item(
+            {
+                "content": _pytest_regex(r"<p>may the <em>force</em> be with you</p>"),
+                "destination": pathlib.Path("1.html"),
+                "title": "yoda",
+                **expected,
+            }
+        )
+    ]
+
+
 @pytest.mark.parametrize(
     ("args", "error"),
     [
@@ -365,7 +489,12 @@ def test_item_many(testapp, amount):
             {"settings": 42},
             "settings: 42 is not of type 'object'",
             id="settings-int",
-        )
+        ),
+        pytest.param(
+            {"outline": 42},
+            "outline: 42 is not of type 'boolean'",
+            id="outline-int",
+        ),
     ],
 )
 def test_args_bad_value(testapp, args, error):
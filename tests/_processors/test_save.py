@@ -2,6 +2,7 @@
 
 import collections.abc
 import pathlib
+import unittest.mock
 
 import py
 import pytest
@@ -32,6 +33,27 @@ def test_item(testapp, monkeypatch, tmpdir):
     assert tmpdir.join("_site", "1.html").read_text("UTF-8") == "Obi-Wan"
 
 
+def test_item_bytes_written(testapp, monkeypatch, tmpdir):
+    """Save processor has to report a number of bytes written."""
+
+    monkeypatch.chdir(tmpdir)
+    testapp.metric = unittest.mock.Mock()
+
+    stream = save.process(
+        testapp,
+        [
+            holocron.Item({"content": "Оби-Ван", "destination": pathlib.Path("1.html")}),
+            holocron.Item({"content": b"\xf1", "destination": pathlib.Path("2.dat")}),
+        ],
+    )
+
+    assert len(list(stream)) == 2
+    assert testapp.metric.call_args_list == [
+        unittest.mock.call("bytes_written", 13),
+        unittest.mock.call("bytes_written", 1),
+    ]
+
+
 @pytest.mark.parametrize(
     ("data", "loader"),
     [
@@ -54,6 +76,102 @@ def test_item_content_types(testapp, monkeypatch, tmpdir, data, loader):
     assert loader(tmpdir.join("_site", "1.dat")) == data
 
 
+@pytest.mark.parametrize("encoding", [pytest.param("UTF-8"), pytest.param("UTF-16")])
+def test_item_content_chunks(testapp, monkeypatch, tmpdir, encoding):
+    """Save processor has to save content of iterator of chunks type."""
+
+    monkeypatch.chdir(tmpdir)
+
+    chunks = iter(["Обі", "-", "Ван"])
+    stream = save.process(
+        testapp,
+        [holocron.Item({"content": chunks, "destination": pathlib.Path("1.html")})],
+        encoding=encoding,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        holocron.Item({"content": chunks, "destination": pathlib.Path("1.html")})
+    ]
+    assert tmpdir.join("_site", "1.html").read_text(encoding) == "Обі-Ван"
+
+
+@pytest.mark.parametrize(
+    ("link", "linked"),
+    [
+        pytest.param(False, False, id="copy"),
+        pytest.param(True, True, id="link"),
+    ],
+)
+def test_item_content_file(testapp, monkeypatch, tmpdir, link, linked):
+    """Save processor has to copy or link content of path type."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("static", "style.css").write_text("article {}", encoding="UTF-8")
+    tmpdir.ensure("_site", "style.css").write_text("outdated", encoding="UTF-8")
+    content = pathlib.Path(tmpdir.strpath, "static", "style.css")
+
+    for _ in range(2):
+        stream = save.process(
+            testapp,
+            [holocron.Item({"content": content, "destination": pathlib.Path("style.css")})],
+            link=link,
+        )
+
+        assert isinstance(stream, collections.abc.Iterable)
+        assert list(stream) == [
+            holocron.Item({"content": content, "destination": pathlib.Path("style.css")})
+        ]
+        assert tmpdir.join("_site", "style.css").read_text("UTF-8") == "article {}"
+        assert tmpdir.join("_site", "style.css").samefile(content) is linked
+
+
+@pytest.mark.parametrize(
+    "overwrite",
+    [
+        pytest.param("article {}", id="str"),
+        pytest.param(b"article {}", id="bytes"),
+        pytest.param(iter(["article ", "{}"]), id="chunks"),
+    ],
+)
+def test_item_content_file_linked_overwrite(testapp, monkeypatch, tmpdir, overwrite):
+    """Save processor has to not overwrite a linked file through its link."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("static", "style.css").write_text("outdated", encoding="UTF-8")
+    content = pathlib.Path(tmpdir.strpath, "static", "style.css")
+
+    for content_, link in [(content, True), (overwrite, False)]:
+        stream = save.process(
+            testapp,
+            [holocron.Item({"content": content_, "destination": pathlib.Path("style.css")})],
+            link=link,
+        )
+        list(stream)
+
+    assert tmpdir.join("_site", "style.css").read_text("UTF-8") == "article {}"
+    assert tmpdir.join("static", "style.css").read_text("UTF-8") == "outdated"
+
+
+def test_item_content_file_linked_copy(testapp, monkeypatch, tmpdir):
+    """Save processor has to copy a file over its own link."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("static", "style.css").write_text("article {}", encoding="UTF-8")
+    content = pathlib.Path(tmpdir.strpath, "static", "style.css")
+
+    for link in (True, False):
+        stream = save.process(
+            testapp,
+            [holocron.Item({"content": content, "destination": pathlib.Path("style.css")})],
+            link=link,
+        )
+        list(stream)
+
+    assert tmpdir.join("_site", "style.css").read_text("UTF-8") == "article {}"
+    assert not tmpdir.join("_site", "style.css").samefile(content)
+
+
 @pytest.mark.parametrize(
     "destination",
     [
@@ -1,8 +1,15 @@
 """Source processor test suite."""
 
 import collections.abc
+import io
+import mimetypes
+import os
 import pathlib
+import subprocess
+import tarfile
+import time
 import unittest.mock
+import zipfile
 
 import pytest
 
@@ -32,9 +39,9 @@ def testapp():
 @pytest.mark.parametrize(
     "path",
     [
-        pytest.param(["about", "luke", "cv.pdf"], id="deep-subdir"),
-        pytest.param(["about", "cv.pdf"], id="subdir"),
-        pytest.param(["cv.pdf"], id="flat"),
+        pytest.param(["about", "luke", "cv.md"], id="deep-subdir"),
+        pytest.param(["about", "cv.md"], id="subdir"),
+        pytest.param(["cv.md"], id="flat"),
         pytest.param([".post"], id="hidden"),
     ],
 )
@@ -90,6 +97,58 @@ def test_item_content_types(testapp, monkeypatch, tmpdir, data):
     ]
 
 
+@pytest.mark.parametrize(
+    ("filename", "data", "content"),
+    [
+        pytest.param("cv.md", b"Obi-Wan", "Obi-Wan", id="text"),
+        pytest.param("logo.svg", b"<svg/>", "<svg/>", id="text-xml"),
+        pytest.param("data.json", b"{}", "{}", id="text-json"),
+        pytest.param("cv.pdf", b"Obi-Wan", b"Obi-Wan", id="binary"),
+        pytest.param("logo.PNG", b"Obi-Wan", b"Obi-Wan", id="binary-upper"),
+        pytest.param("font.woff2", b"Obi-Wan", b"Obi-Wan", id="binary-font"),
+        pytest.param("posts.tar.gz", b"Obi-Wan", b"Obi-Wan", id="binary-compressed"),
+        pytest.param("cv.unknown", b"Obi-Wan", "Obi-Wan", id="unknown-text"),
+        pytest.param("cv.unknown", b"Obi\0Wan", b"Obi\0Wan", id="unknown-binary"),
+        pytest.param("cv", b"\xf1", b"\xf1", id="unknown-undecodable"),
+    ],
+)
+def test_item_binary(testapp, monkeypatch, tmpdir, filename, data, content):
+    """Source processor has to classify binary items by extension."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure(filename).write_binary(data)
+
+    stream = source.process(testapp, [])
+
+    assert [item["content"] for item in stream] == [content]
+
+
+def test_item_binary_system_mimetypes(testapp, monkeypatch, tmpdir):
+    """Source processor has to not depend on system MIME databases."""
+
+    monkeypatch.chdir(tmpdir)
+    monkeypatch.setattr(
+        mimetypes, "guess_type", unittest.mock.Mock(return_value=("video/mp2t", None))
+    )
+    monkeypatch.setattr(source, "_isbinary", source._isbinary.__wrapped__)
+    tmpdir.ensure("app.ts").write_binary(b"let yoda = 42;")
+
+    stream = source.process(testapp, [])
+
+    assert [item["content"] for item in stream] == ["let yoda = 42;"]
+
+
+def test_item_newlines(testapp, monkeypatch, tmpdir):
+    """Source processor has to translate line endings of text items."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("cv.md").write_binary(b"a\r\nb\rc\n")
+
+    stream = source.process(testapp, [])
+
+    assert [item["content"] for item in stream] == ["a\nb\nc\n"]
+
+
 def test_item_empty(testapp, monkeypatch, tmpdir):
     """Source processor has to properly read empty items."""
 
@@ -113,6 +172,43 @@ def test_item_empty(testapp, monkeypatch, tmpdir):
     ]
 
 
+def test_item_symlinks(testapp, monkeypatch, tmpdir):
+    """Source processor has to read symlinked files but not directories."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("content", "cv.md").write_text("Obi-Wan", encoding="UTF-8")
+    tmpdir.join("content", "link.md").mksymlinkto(tmpdir.join("content", "cv.md"))
+    tmpdir.join("content", "link").mksymlinkto(tmpdir.join("content"))
+
+    stream = source.process(testapp, [], path="content")
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert sorted(item["source"] for item in stream) == [
+        pathlib.Path("cv.md"),
+        pathlib.Path("link.md"),
+    ]
+
+
+def test_item_expected(testapp, monkeypatch, tmpdir):
+    """Source processor has to report a number of items to be produced."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("cv.md")
+    tmpdir.ensure("about", "photo.png")
+    testapp.metric = unittest.mock.Mock()
+
+    stream = source.process(testapp, [holocron.Item()])
+
+    # Items are reported as they are found, so the first item is produced
+    # before the whole tree is walked.
+    assert next(stream) == holocron.Item()
+    assert next(stream)
+    assert testapp.metric.call_args_list == [unittest.mock.call("expected", 1)]
+
+    assert len(list(stream)) == 1
+    assert testapp.metric.call_args_list == [unittest.mock.call("expected", 1)] * 2
+
+
 @pytest.mark.parametrize(
     "discovered",
     [
@@ -238,6 +334,455 @@ def test_args_pattern(testapp, monkeypatch, tmpdir):
     ]
 
 
+@pytest.mark.parametrize(
+    ("exclude", "expected"),
+    [
+        pytest.param(["_site"], ["cv.md", "docs/a.md", "docs/b.rst"], id="name"),
+        pytest.param(
+            ["/_site/"], ["cv.md", "docs/_site/x.md", "docs/a.md", "docs/b.rst"], id="anchored"
+        ),
+        pytest.param(
+            ["docs/_site"], ["_site/x.md", "cv.md", "docs/a.md", "docs/b.rst"], id="literal"
+        ),
+        pytest.param(["*.md"], ["docs/b.rst"], id="glob"),
+        pytest.param(["**/x.md", "docs/*.rst"], ["cv.md", "docs/a.md"], id="globstar"),
+        pytest.param(["*.md", "!a.md"], ["docs/a.md", "docs/b.rst"], id="negate"),
+        pytest.param(["docs", "!docs/a.md"], ["_site/x.md", "cv.md"], id="negate-pruned"),
+        pytest.param(
+            ["cv.md/"],
+            ["_site/x.md", "cv.md", "docs/_site/x.md", "docs/a.md", "docs/b.rst"],
+            id="dironly",
+        ),
+    ],
+)
+def test_args_exclude(testapp, monkeypatch, tmpdir, exclude, expected):
+    """Source processor has to respect exclude argument."""
+
+    monkeypatch.chdir(tmpdir)
+
+    for path in ["cv.md", "_site/x.md", "docs/a.md", "docs/b.rst", "docs/_site/x.md"]:
+        tmpdir.ensure(path)
+
+    stream = source.process(testapp, [], exclude=exclude)
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert sorted(item["source"].as_posix() for item in stream) == expected
+
+
+def test_args_exclude_prune(testapp, monkeypatch, tmpdir):
+    """Source processor has to not walk excluded directories."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("cv.md")
+    tmpdir.ensure(".git", "objects", "ab")
+    tmpdir.ensure("node_modules", "x", "index.js")
+
+    scandir = unittest.mock.Mock(wraps=source.os.scandir)
+    monkeypatch.setattr(source.os, "scandir", scandir)
+
+    stream = source.process(testapp, [], exclude=[".git/", "/node_modules"])
+
+    assert [item["source"] for item in stream] == [pathlib.Path("cv.md")]
+    assert scandir.call_args_list == [unittest.mock.call(".")]
+
+
+def test_args_exclude_holocronignore(testapp, monkeypatch, tmpdir):
+    """Source processor has to respect .holocronignore file."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("content", "cv.md")
+    tmpdir.ensure("content", "_site", "cv.html")
+    tmpdir.ensure("content", "draft.md")
+    tmpdir.join("content", ".holocronignore").write_text(
+        "# build output\n_site/\n",
+        encoding="UTF-8",
+    )
+
+    stream = source.process(testapp, [], path="content", exclude=["draft.md"])
+
+    assert [item["source"] for item in stream] == [pathlib.Path("cv.md")]
+
+
+def test_args_exclude_holocronignore_negated(testapp, monkeypatch, tmpdir):
+    """Source processor has to produce .holocronignore file if asked to."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("content", "cv.md")
+    tmpdir.join("content", ".holocronignore").write_text("_site/\n", encoding="UTF-8")
+
+    stream = source.process(testapp, [], path="content", exclude=["!.holocronignore"])
+
+    assert sorted(item["source"] for item in stream) == [
+        pathlib.Path(".holocronignore"),
+        pathlib.Path("cv.md"),
+    ]
+
+
+def test_args_manifest(testapp, monkeypatch, tmpdir, caplog):
+    """Source processor has to mark unchanged items."""
+
+    caplog.set_level("INFO")
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("content", "a.md").write_text("Obi-Wan", encoding="UTF-8")
+    tmpdir.ensure("content", "b.md").write_text("Yoda", encoding="UTF-8")
+    tmpdir.ensure("content", "c.md").write_text("Vader", encoding="UTF-8")
+
+    def run(**args):
+        stream = source.process(
+            testapp, [], path="content", manifest=".cache/manifest.json", **args
+        )
+        return {str(item["source"]): item["unchanged"] for item in stream}
+
+    assert run() == {"a.md": False, "b.md": False, "c.md": False}
+    assert run() == {"a.md": True, "b.md": True, "c.md": True}
+
+    # Touched yet not modified files are compared by content.
+    tmpdir.join("content", "a.md").setmtime(42)
+    tmpdir.join("content", "b.md").write_text("Luke", encoding="UTF-8")
+    tmpdir.join("content", "c.md").remove()
+
+    assert run() == {"a.md": True, "b.md": False}
+    assert caplog.messages == ["source: deleted: 'c.md'"]
+
+    tmpdir.join("content", "b.md").write_text("Leia", encoding="UTF-8")
+    assert run(skip_unchanged=True) == {"b.md": False}
+    assert run(skip_unchanged=True) == {}
+    assert run() == {"a.md": True, "b.md": True}
+
+
+def test_args_manifest_malformed(testapp, monkeypatch, tmpdir, caplog):
+    """Source processor has to ignore malformed manifest."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("content", "a.md").write_text("Obi-Wan", encoding="UTF-8")
+    tmpdir.join("manifest.json").write_text("{", encoding="UTF-8")
+
+    stream = source.process(testapp, [], path="content", manifest="manifest.json")
+
+    assert [item["unchanged"] for item in stream] == [False]
+    assert caplog.messages == ["source: malformed manifest, ignoring: 'manifest.json'"]
+
+
+def _create_archive(path, members, mtime):
+    if path.endswith(".zip"):
+        with zipfile.ZipFile(path, "w") as archive:
+            for name, data in members:
+                # Zip archives store time without timezone, and source
+                # processor assumes it's UTC unless told otherwise.
+                info = zipfile.ZipInfo(name, time.gmtime(mtime)[:6])
+                archive.writestr(info, data)
+    else:
+        with tarfile.open(path, "w:gz" if path.endswith(".gz") else "w") as archive:
+            for name, data in members:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mtime = mtime
+                archive.addfile(info, io.BytesIO(data))
+
+
+@pytest.mark.parametrize("archive", ["content.tar", "content.tar.gz", "content.zip"])
+def test_args_path_archive(testapp, monkeypatch, tmpdir, archive):
+    """Source processor has to read items from archives."""
+
+    monkeypatch.chdir(tmpdir)
+
+    _create_archive(
+        archive,
+        [
+            ("cv.md", "Оби-Ван".encode()),
+            ("./about/photo.png", b"\xf1"),
+            ("../secret", b"Vader"),
+        ],
+        mtime=1546300800,
+    )
+
+    stream = source.process(testapp, [], path=archive)
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        holocron.WebSiteItem(
+            {
+                "source": pathlib.Path("cv.md"),
+                "destination": pathlib.Path("cv.md"),
+                "content": "Оби-Ван",
+                "created": _pytest_timestamp(1546300800),
+                "updated": _pytest_timestamp(1546300800),
+                "baseurl": testapp.metadata["url"],
+            }
+        ),
+        holocron.WebSiteItem(
+            {
+                "source": pathlib.Path("about", "photo.png"),
+                "destination": pathlib.Path("about", "photo.png"),
+                "content": b"\xf1",
+                "created": _pytest_timestamp(1546300800),
+                "updated": _pytest_timestamp(1546300800),
+                "baseurl": testapp.metadata["url"],
+            }
+        ),
+    ]
+
+
+@pytest.mark.parametrize("archive", ["content.tar", "content.zip"])
+def test_args_path_archive_filters(testapp, monkeypatch, tmpdir, archive):
+    """Source processor has to apply pattern and exclude to archive members."""
+
+    monkeypatch.chdir(tmpdir)
+    _create_archive(
+        archive,
+        [
+            ("posts/a.md", b"a"),
+            ("posts/b.rst", b"b"),
+            ("posts/_site/c.md", b"c"),
+            ("d.md", b"d"),
+        ],
+        mtime=1546300800,
+    )
+
+    stream = source.process(testapp, [], path=archive, pattern=r"posts", exclude=["_site/"])
+
+    assert [item["source"] for item in stream] == [
+        pathlib.Path("posts", "a.md"),
+        pathlib.Path("posts", "b.rst"),
+    ]
+
+
+@pytest.mark.parametrize("archive", ["content.tar", "content.zip"])
+@pytest.mark.parametrize(
+    "name",
+    [
+        pytest.param("/etc/passwd", id="absolute"),
+        pytest.param("C:/passwd", id="drive"),
+        pytest.param("../passwd", id="parent"),
+        pytest.param("posts/../../passwd", id="parent-nested"),
+    ],
+)
+def test_args_path_archive_unsafe(testapp, monkeypatch, tmpdir, caplog, archive, name):
+    """Source processor has to skip archive members pointing outside of it."""
+
+    monkeypatch.chdir(tmpdir)
+    _create_archive(archive, [(name, b"a"), ("b.md", b"b")], mtime=1546300800)
+
+    stream = source.process(testapp, [], path=archive)
+
+    assert [item["source"] for item in stream] == [pathlib.Path("b.md")]
+    assert caplog.messages == [f"source: skipping unsafe archive member: '{name}'"]
+
+
+def test_args_path_archive_malformed(testapp, monkeypatch, tmpdir):
+    """Source processor has to reject files that are not archives."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("content.md").write_text("yoda", encoding="UTF-8")
+
+    with pytest.raises(ValueError) as excinfo:
+        next(source.process(testapp, [], path="content.md"))
+    assert str(excinfo.value) == "'path' is not a tar or zip archive: 'content.md'"
+
+
+def test_args_path_archive_manifest(testapp, monkeypatch, tmpdir):
+    """Source processor has to reject manifest for archives."""
+
+    monkeypatch.chdir(tmpdir)
+    _create_archive("content.tar", [("cv.md", b"")], mtime=1546300800)
+
+    with pytest.raises(ValueError) as excinfo:
+        next(source.process(testapp, [], path="content.tar", manifest="manifest.json"))
+    assert str(excinfo.value) == "'manifest' cannot be set when 'path' is an archive"
+
+
+@pytest.mark.parametrize(
+    ("data", "head", "content"),
+    [
+        pytest.param(
+            b"---\ntitle: Yoda\n---\n" + b"x" * 10000,
+            1024,
+            "---\ntitle: Yoda\n---\n",
+            id="yaml",
+        ),
+        pytest.param(
+            b"+++\r\ntitle = 'Yoda'\r\n+++\r\n" + b"x" * 10000,
+            1024,
+            "+++\ntitle = 'Yoda'\n+++\n",
+            id="toml-crlf",
+        ),
+        pytest.param(
+            b'{\n  "title": "Yoda"\n}\n' + b"x" * 10000,
+            1024,
+            '{\n  "title": "Yoda"\n}\n',
+            id="json",
+        ),
+        pytest.param(
+            b"---\ntitle: " + b"x" * 10000 + b"\n---\n",
+            8192,
+            "---\ntitle: " + "x" * 8181,
+            id="capped",
+        ),
+        pytest.param(
+            b"---\ntitle: " + "й".encode() * 10 + b"\n",
+            12,
+            "---\ntitle: ",
+            id="capped-multibyte",
+        ),
+        pytest.param(b"x" * 10000, 8192, "x" * 4096, id="no-frontmatter"),
+    ],
+)
+def test_args_head(testapp, monkeypatch, tmpdir, data, head, content):
+    """Source processor has to read heads of files if asked."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("cv.md").write_binary(data)
+
+    stream = source.process(testapp, [], head=head)
+
+    assert [(item["content"], item["partial"]) for item in stream] == [(content, True)]
+
+
+def test_args_head_whole(testapp, monkeypatch, tmpdir):
+    """Source processor has to not mark entirely read files as partial."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("cv.md").write_text("---\ntitle: Yoda\n---\n", encoding="UTF-8")
+
+    stream = source.process(testapp, [], head=1024)
+
+    assert [(item["content"], "partial" in item) for item in stream] == [
+        ("---\ntitle: Yoda\n---\n", False)
+    ]
+
+
+def test_args_binary(testapp, monkeypatch, tmpdir):
+    """Source processor has to respect binary argument."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("assets", "data.txt").write_text("Obi-Wan", encoding="UTF-8")
+    tmpdir.ensure("cv.txt").write_text("Obi-Wan", encoding="UTF-8")
+
+    stream = source.process(testapp, [], binary=r"assets/")
+
+    assert {str(item["source"]): item["content"] for item in stream} == {
+        os.path.join("assets", "data.txt"): b"Obi-Wan",
+        "cv.txt": "Obi-Wan",
+    }
+
+
+def test_args_lazy(testapp, monkeypatch, tmpdir):
+    """Source processor has to reference files instead of reading if asked."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("static", "style.css").write_text("article {}", encoding="UTF-8")
+
+    stream = source.process(testapp, [], lazy=True)
+
+    assert list(stream) == [
+        holocron.WebSiteItem(
+            {
+                "source": pathlib.Path("static", "style.css"),
+                "destination": pathlib.Path("static", "style.css"),
+                "content": pathlib.Path(tmpdir.strpath, "static", "style.css"),
+                "created": unittest.mock.ANY,
+                "updated": unittest.mock.ANY,
+                "baseurl": testapp.metadata["url"],
+            }
+        )
+    ]
+
+
+def test_args_path_archive_lazy(testapp, monkeypatch, tmpdir):
+    """Source processor has to reject lazy mode for archives."""
+
+    monkeypatch.chdir(tmpdir)
+    _create_archive("content.tar", [("cv.md", b"")], mtime=1546300800)
+
+    with pytest.raises(ValueError) as excinfo:
+        next(source.process(testapp, [], path="content.tar", lazy=True))
+    assert str(excinfo.value) == "'lazy' cannot be set when 'path' is an archive"
+
+
+@pytest.fixture
+def git(monkeypatch, tmpdir):
+    monkeypatch.setenv("GIT_AUTHOR_NAME", "yoda")
+    monkeypatch.setenv("GIT_AUTHOR_EMAIL", "yoda@jedi.ua")
+    monkeypatch.setenv("GIT_COMMITTER_NAME", "yoda")
+    monkeypatch.setenv("GIT_COMMITTER_EMAIL", "yoda@jedi.ua")
+
+    def git(*args, timestamp=None):
+        if timestamp is not None:
+            monkeypatch.setenv("GIT_AUTHOR_DATE", "@%d +0000" % timestamp)
+        subprocess.check_call(["git", *args], cwd=tmpdir.strpath, stdout=subprocess.DEVNULL)
+
+    git("init", "-q")
+    return git
+
+
+def test_args_timestamps_git(testapp, monkeypatch, tmpdir, git):
+    """Source processor has to take timestamps from git history."""
+
+    monkeypatch.chdir(tmpdir)
+
+    tmpdir.ensure("content", "a.md").write_text("Obi-Wan", encoding="UTF-8")
+    tmpdir.ensure("content", "b.md").write_text("Yoda", encoding="UTF-8")
+    git("add", "-A")
+    git("commit", "-qm", "1", timestamp=1000000000)
+
+    tmpdir.join("content", "a.md").write_text("Obi-Wan Kenobi", encoding="UTF-8")
+    git("mv", "content/b.md", "content/c.md")
+    git("commit", "-qam", "2", timestamp=1100000000)
+
+    git("rm", "-q", "content/a.md")
+    git("commit", "-qm", "3", timestamp=1200000000)
+
+    tmpdir.ensure("content", "a.md").write_text("Luke", encoding="UTF-8")
+    git("add", "-A")
+    git("commit", "-qm", "4", timestamp=1300000000)
+
+    tmpdir.ensure("content", "d.md").write_text("Vader", encoding="UTF-8")
+
+    stream = source.process(testapp, [], path="content", timestamps="git")
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert {str(item["source"]): (item["created"], item["updated"]) for item in stream} == {
+        "a.md": (_pytest_timestamp(1300000000), _pytest_timestamp(1300000000)),
+        "c.md": (_pytest_timestamp(1000000000), _pytest_timestamp(1100000000)),
+        "d.md": (
+            _pytest_timestamp(tmpdir.join("content", "d.md").stat().ctime),
+            _pytest_timestamp(tmpdir.join("content", "d.md").stat().mtime),
+        ),
+    }
+
+
+def test_args_timestamps_git_no_repo(testapp, monkeypatch, tmpdir, caplog):
+    """Source processor has to fall back to file timestamps."""
+
+    monkeypatch.chdir(tmpdir)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", tmpdir.strpath)
+    tmpdir.ensure("cv.md").write_text("Obi-Wan", encoding="UTF-8")
+
+    stream = source.process(testapp, [], timestamps="git")
+
+    assert [item["updated"] for item in stream] == [
+        _pytest_timestamp(tmpdir.join("cv.md").stat().mtime)
+    ]
+    assert caplog.messages[0].startswith("source: cannot read git history")
+
+
+@pytest.mark.parametrize("workers", [pytest.param(2), pytest.param(4), pytest.param(16)])
+def test_args_workers(testapp, monkeypatch, tmpdir, workers):
+    """Source processor has to read files in parallel preserving walk order."""
+
+    monkeypatch.chdir(tmpdir)
+
+    for i in range(50):
+        tmpdir.ensure(str(i % 3), str(i)).write_text("key=%d" % i, encoding="UTF-8")
+
+    expected = list(source.process(testapp, []))
+    stream = source.process(testapp, [], workers=workers)
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == expected
+    assert len(expected) == 50
+
+
 @pytest.mark.parametrize("encoding", [pytest.param("CP1251"), pytest.param("UTF-16")])
 def test_args_encoding(testapp, monkeypatch, tmpdir, encoding):
     """Source processor has to respect encoding argument."""
@@ -385,6 +930,51 @@ def test_args_timezone_in_action(testapp, monkeypatch, tmpdir):
             "timezone: 'Europe/Kharkiv' is not a 'timezone'",
             id="timezone-wrong",
         ),
+        pytest.param(
+            {"binary": 42},
+            "binary: 42 is not of type 'string'",
+            id="binary-int",
+        ),
+        pytest.param(
+            {"exclude": "_site"},
+            "exclude: '_site' is not of type 'array'",
+            id="exclude-str",
+        ),
+        pytest.param(
+            {"skip_unchanged": True},
+            "'skip_unchanged' cannot be set without 'manifest'",
+            id="skip-unchanged-without-manifest",
+        ),
+        pytest.param(
+            {"timestamps": "mtime"},
+            "timestamps: 'mtime' is not one of ['stat', 'git']",
+            id="timestamps-wrong",
+        ),
+        pytest.param(
+            {"head": 0},
+            "head: 0 is less than or equal to the minimum of 0",
+            id="head-zero",
+        ),
+        pytest.param(
+            {"head": 1024, "manifest": "manifest.json"},
+            "'head' cannot be set along with 'manifest'",
+            id="head-with-manifest",
+        ),
+        pytest.param(
+            {"lazy": True, "head": 1024},
+            "'lazy' cannot be set along with 'head' or 'manifest'",
+            id="lazy-with-head",
+        ),
+        pytest.param(
+            {"lazy": True, "manifest": "manifest.json"},
+            "'lazy' cannot be set along with 'head' or 'manifest'",
+            id="lazy-with-manifest",
+        ),
+        pytest.param(
+            {"workers": 0},
+            "workers: 0 is less than the minimum of 1",
+            id="workers-zero",
+        ),
     ],
 )
 def test_args_bad_value(testapp, args, error):
@@ -1,7 +1,10 @@
 """Tests Holocron CLI."""
 
+import json
 import logging
 import pathlib
+import pstats
+import re
 import subprocess
 import sys
 import textwrap
@@ -70,7 +73,7 @@ def test_run_progress_info(monkeypatch, tmpdir, execute, example_site):
 
     monkeypatch.chdir(tmpdir)
 
-    assert set(execute(["run", "test"]).splitlines()) == {
+    assert set(execute(["-v", "run", "test"]).splitlines()) == {
         b"==> .holocron.yml",
         b"==> cv.md",
         b"==> 2019/02/12/skywalker/index.html",
@@ -87,7 +90,7 @@ def test_run_progress_info_colored(monkeypatch, tmpdir, execute, example_site):
     monkeypatch.setattr(sys.stdout, "isatty", mock.Mock(return_value=True))
     monkeypatch.chdir(tmpdir)
 
-    assert set(execute(["run", "test"], as_subprocess=False).splitlines()) == {
+    assert set(execute(["-v", "run", "test"], as_subprocess=False).splitlines()) == {
         "\x1b[1m\x1b[32m==>\x1b[0m \x1b[1m.holocron.yml\x1b[0m",
         "\x1b[1m\x1b[32m==>\x1b[0m \x1b[1mcv.md\x1b[0m",
         "\x1b[1m\x1b[32m==>\x1b[0m \x1b[1m2019/02/12/skywalker/index.html\x1b[0m",
@@ -95,6 +98,36 @@ def test_run_progress_info_colored(monkeypatch, tmpdir, execute, example_site):
     }
 
 
+def test_run_progress_summary(monkeypatch, tmpdir, capsys, example_site):
+    """Build summary is shown on standard error."""
+
+    from holocron.__main__ import main
+
+    monkeypatch.chdir(tmpdir)
+
+    main(["run", "test"])
+    out, err = capsys.readouterr()
+
+    assert out == ""
+    assert re.fullmatch(
+        r"Built 4 items in \d+\.\ds \(\d+\.\d items/s\), %d bytes written\n"
+        % (tmpdir.join(".holocron.yml").size() + len(b"yoda") + len(b"luke")),
+        err,
+    )
+
+
+def test_run_progress_quiet(monkeypatch, tmpdir, capsys, example_site):
+    """Nothing is shown in quiet mode."""
+
+    from holocron.__main__ import main
+
+    monkeypatch.chdir(tmpdir)
+
+    main(["-q", "run", "test"])
+
+    assert capsys.readouterr() == ("", "")
+
+
 def test_run_conf_yml_not_found(monkeypatch, tmpdir, execute, example_site):
     """Proceed with default settings."""
 
@@ -205,3 +238,146 @@ def test_run_conf_yml_interpolate_in_path(monkeypatch, tmpdir, execute, example_
     execute(["-c", tmpdir.join(".holocron.yml").strpath, "run", "test"])
 
     assert tmpdir.join("_compiled", "cv.md").read_binary() == b"yoda"
+
+
+def test_run_trace(monkeypatch, tmpdir, execute, example_site):
+    """Trace file is written in Chrome Trace Event Format."""
+
+    monkeypatch.chdir(tmpdir)
+
+    execute(["run", "test", "--trace", "trace.json"])
+
+    trace = json.loads(tmpdir.join("trace.json").read_text(encoding="UTF-8"))
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert {event["name"] for event in spans} == {"source", "save"}
+    assert {event["args"]["source"] for event in spans if event["args"]} == {
+        ".holocron.yml",
+        "cv.md",
+        "2019/02/12/skywalker/index.html",
+        "about/photo.png",
+    }
+
+
+def test_run_trace_failure(monkeypatch, tmpdir, execute, example_site):
+    """Trace file is written even if a pipe fails."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join(".holocron.yml").write_text(
+        yaml.safe_dump(
+            {"metadata": None, "pipes": {"test": [{"name": "source", "args": {"path": "cv.md"}}]}}
+        ),
+        encoding="UTF-8",
+    )
+
+    with pytest.raises(subprocess.CalledProcessError):
+        execute(["run", "test", "--trace", "trace.json"])
+
+    trace = json.loads(tmpdir.join("trace.json").read_text(encoding="UTF-8"))
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [(event["name"], event["args"]) for event in spans] == [
+        ("source", {"error": "ValueError(\"'path' is not a tar or zip archive: 'cv.md'\")"}),
+    ]
+
+
+def test_run_profile(monkeypatch, tmpdir, execute, example_site):
+    """Profile dump is written."""
+
+    monkeypatch.chdir(tmpdir)
+
+    execute(["run", "test", "--profile", "out.prof"])
+
+    stats = pstats.Stats(tmpdir.join("out.prof").strpath)
+    assert stats.total_calls > 0
+
+
+def test_compile_theme(monkeypatch, tmpdir, execute):
+    """Theme templates are precompiled."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("theme", "templates", "item.j2").write_text("{{ item.title }}", "UTF-8")
+    tmpdir.ensure("theme", "templates", "page.j2").write_text("{{ item.title }}", "UTF-8")
+
+    execute(["compile-theme", "theme"])
+
+    assert len(tmpdir.join("theme", "templates.compiled").listdir()) == 2
+
+
+def test_compile_theme_no_templates(monkeypatch, tmpdir, execute):
+    """Error message is printed."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("theme", dir=True)
+
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        execute(["compile-theme", "theme"])
+
+    assert str(excinfo.value.stderr.decode("UTF-8").strip()) == (
+        "Cannot compile a theme, no templates found: 'theme'"
+    )
+
+
+def test_configure_logger_pending(capsys):
+    """Log records are printed on exit by default."""
+
+    from holocron.__main__ import configure_logger
+
+    with configure_logger(logging.INFO):
+        logging.getLogger().warning("the Force")
+        assert capsys.readouterr().err == ""
+
+    assert capsys.readouterr().err == "[WARN] the Force\n"
+
+
+def test_configure_logger_streaming(capsys):
+    """Log records are printed once buffer is full."""
+
+    from holocron.__main__ import configure_logger
+
+    with configure_logger(logging.INFO, capacity=2, interval=3600):
+        logging.getLogger().warning("the Force")
+        assert capsys.readouterr().err == ""
+
+        logging.getLogger().info("is strong")
+        assert capsys.readouterr().err == "[WARN] the Force\n[INFO] is strong\n"
+
+        logging.getLogger().error("with this one")
+        assert capsys.readouterr().err == ""
+
+    assert capsys.readouterr().err == "[ERRO] with this one\n"
+
+
+def test_configure_logger_before_flush(capsys):
+    """A given function is called before log records are printed."""
+
+    from holocron.__main__ import configure_logger
+
+    before_flush = mock.Mock(side_effect=lambda: sys.stderr.write("\r"))
+
+    with configure_logger(logging.INFO, capacity=1, interval=3600, before_flush=before_flush):
+        assert before_flush.call_count == 0
+
+        logging.getLogger().warning("the Force")
+        assert capsys.readouterr().err == "\r[WARN] the Force\n"
+        assert before_flush.call_count == 1
+
+    assert before_flush.call_count == 1
+
+
+def test_configure_logger_log_file(tmpdir, capsys):
+    """Log records are written to a file as JSON lines."""
+
+    from holocron.__main__ import configure_logger
+
+    log_file = tmpdir.join("build.log")
+
+    with configure_logger(logging.INFO, capacity=0, log_file=log_file.strpath):
+        logging.getLogger().warning("the Force")
+        logging.getLogger().debug("is strong")
+
+    assert capsys.readouterr().err == "[WARN] the Force\n"
+
+    records = [json.loads(line) for line in log_file.read_text(encoding="UTF-8").splitlines()]
+    assert len(records) == 1
+    assert records[0]["level"] == "WARNING"
+    assert records[0]["logger"] == logging.getLogger().name
+    assert records[0]["message"] == "the Force"